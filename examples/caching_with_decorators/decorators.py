@@ -1,43 +1,144 @@
 # examples/caching_with_decorators/decorators.py
+import asyncio
+import logging
+import sys
 import time
-from typing import Dict, Tuple
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
 from wd.di import ServiceProvider # Assuming ServiceProvider is available for type hinting
 from services import IExternalWeatherService
 
+_KEY_CACHE_MAX = 256  # upper bound on remembered city -> key spellings
+
+
 class CachingWeatherServiceDecorator(IExternalWeatherService):
-    def __init__(self, inner: IExternalWeatherService, cache_duration_seconds: int = 60):
+    __slots__ = (
+        "_cache",
+        "_cache_duration",
+        "_cache_get",
+        "_cache_move",
+        "_cache_popitem",
+        "_fetch_locks",
+        "_inner",
+        "_key_cache",
+        "_log",
+        "_max_entries",
+        "_now",
+    )
+
+    def __init__(self, inner: IExternalWeatherService, cache_duration_seconds: int = 60, max_entries: int = 1024):
         self._inner = inner
-        self._cache: Dict[str, Tuple[float, float]] = {} # Key: city, Value: (timestamp, temperature)
+        # Key: city, Value: (expiry deadline, temperature); ordered from least to most recently used.
+        self._cache: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
         self._cache_duration = cache_duration_seconds
-        print(f"[CachingWeatherServiceDecorator] Initialized with cache duration: {self._cache_duration}s")
+        self._max_entries = max_entries
+        # Bound once so the hot path avoids repeated attribute lookups.
+        self._cache_get = self._cache.get
+        self._cache_move = self._cache.move_to_end
+        self._cache_popitem = self._cache.popitem
+        self._now = time.monotonic
+        # Maps the caller's spelling of a city to its interned, lower-cased key.
+        self._key_cache: Dict[str, str] = {}
+        # One lock per city so concurrent async misses share a single upstream fetch.
+        self._fetch_locks: Dict[str, asyncio.Lock] = {}
+        # %-style arguments are only formatted when DEBUG is enabled.
+        self._log = logging.getLogger(__name__).debug
+        self._log("[CachingWeatherServiceDecorator] Initialized with cache duration: %ss", self._cache_duration)
 
     def get_current_temperature(self, city: str) -> float:
-        city_key = city.lower()
-        current_time = time.time()
-
-        if city_key in self._cache:
-            timestamp, temperature = self._cache[city_key]
-            if current_time - timestamp < self._cache_duration:
-                print(f"[CachingWeatherServiceDecorator] Cache HIT for {city}. Temp: {temperature}°C")
-                return temperature
-            else:
-                print(f"[CachingWeatherServiceDecorator] Cache STALE for {city}. Re-fetching...")
-        else:
-            print(f"[CachingWeatherServiceDecorator] Cache MISS for {city}. Fetching from real service...")
+        city_key = self._city_key(city)
+        temperature = self._lookup(city, city_key)
+        if temperature is not None:
+            return temperature
 
         # Cache miss or stale, fetch from inner service
         temperature = self._inner.get_current_temperature(city)
-        self._cache[city_key] = (current_time, temperature)
-        print(f"[CachingWeatherServiceDecorator] Cached new temperature for {city}: {temperature}°C")
+        self._store(city, city_key, temperature)
+        return temperature
+
+    async def get_current_temperature_async(self, city: str) -> float:
+        city_key = self._city_key(city)
+        temperature = self._lookup(city, city_key)
+        if temperature is not None:
+            return temperature
+
+        lock = self._fetch_locks.get(city_key)
+        if lock is None:
+            lock = self._fetch_locks[city_key] = asyncio.Lock()
+        async with lock:
+            # Another task may have filled the cache while we waited for the lock.
+            entry = self._cache_get(city_key)
+            if entry is not None and entry[0] > self._now():
+                return entry[1]
+            temperature = await self._inner.get_current_temperature_async(city)
+            self._store(city, city_key, temperature)
         return temperature
 
+    def get_many(self, cities: Iterable[str]) -> List[float]:
+        """Looks up several cities at once, fetching each distinct miss only once."""
+        cities = list(cities)
+        keys = [self._city_key(city) for city in cities]
+        now = self._now()  # one clock read for the whole batch
+        cache_get = self._cache_get
+        results: List[Optional[float]] = []
+        misses: Dict[str, str] = {}  # city_key -> first spelling seen
+        for city, city_key in zip(cities, keys, strict=True):
+            entry = cache_get(city_key)
+            if entry is not None and entry[0] > now:
+                self._cache_move(city_key)
+                results.append(entry[1])
+            else:
+                results.append(None)
+                misses.setdefault(city_key, city)
+
+        fetched = {}
+        for city_key, city in misses.items():
+            fetched[city_key] = temperature = self._inner.get_current_temperature(city)
+            self._store(city, city_key, temperature)
+        self._log("[CachingWeatherServiceDecorator] Batch of %d: %d fetched", len(cities), len(fetched))
+
+        return [fetched[k] if t is None else t for t, k in zip(results, keys, strict=True)]
+
+    def _city_key(self, city: str) -> str:
+        city_key = self._key_cache.get(city)
+        if city_key is None:
+            city_key = sys.intern(city.lower())
+            if len(self._key_cache) < _KEY_CACHE_MAX:
+                self._key_cache[city] = city_key
+        return city_key
+
+    def _lookup(self, city: str, city_key: str) -> Optional[float]:
+        entry = self._cache_get(city_key)
+        if entry is not None:
+            deadline, temperature = entry
+            if deadline > self._now():
+                self._cache_move(city_key)
+                self._log("[CachingWeatherServiceDecorator] Cache HIT for %s. Temp: %s°C", city, temperature)
+                return temperature
+            self._log("[CachingWeatherServiceDecorator] Cache STALE for %s. Re-fetching...", city)
+        else:
+            self._log("[CachingWeatherServiceDecorator] Cache MISS for %s. Fetching from real service...", city)
+        return None
+
+    def _store(self, city: str, city_key: str, temperature: float) -> None:
+        if city_key not in self._cache and len(self._cache) >= self._max_entries:
+            evicted_key, _ = self._cache_popitem(last=False)  # evict least recently used
+            # Its fetch lock goes with it, so the locks stay bounded by the cache.
+            self._fetch_locks.pop(evicted_key, None)
+        self._cache[city_key] = (self._now() + self._cache_duration, temperature)
+        self._cache_move(city_key)
+        self._log("[CachingWeatherServiceDecorator] Cached new temperature for %s: %s°C", city, temperature)
+
     def clear_cache(self):
         self._cache.clear()
-        print("[CachingWeatherServiceDecorator] Cache cleared.")
+        self._fetch_locks.clear()
+        self._log("[CachingWeatherServiceDecorator] Cache cleared.")
 
 # Decorator Factory that creates the CachingWeatherServiceDecorator
 def create_caching_weather_decorator_factory(cache_duration_seconds: int = 60):
-    print(f"[Factory] Creating caching decorator factory with duration: {cache_duration_seconds}s")
+    logging.getLogger(__name__).debug(
+        "[Factory] Creating caching decorator factory with duration: %ss", cache_duration_seconds
+    )
     def actual_factory(provider: ServiceProvider, inner: IExternalWeatherService) -> IExternalWeatherService:
         # `provider` is available if the decorator itself needed other services, not used in this simple cache.
         return CachingWeatherServiceDecorator(inner, cache_duration_seconds)
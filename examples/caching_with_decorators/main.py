@@ -1,12 +1,38 @@
 # examples/caching_with_decorators/main.py
+import asyncio
+import logging
+import sys
 import time
+from typing import TextIO
 import random
-from wd.di import ServiceCollection
+from wd.di import ServiceCollection, ServiceProvider
 from services import IExternalWeatherService, SlowExternalWeatherService
 from decorators import create_caching_weather_decorator_factory
 from console_utils import Colors # Import Colors from the new utility file
 
+def _enable_cache_logging(stream: TextIO) -> None:
+    """Shows the caching decorator's DEBUG records without touching the root logger."""
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger = logging.getLogger("decorators")  # decorators.py logs under its module name
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+
+
+def warmup(provider: ServiceProvider) -> None:
+    """Resolves the weather services once so the first request skips decorator construction.
+
+    The upstream service is deliberately not called: that would cost a slow
+    fetch and count towards the API-call metrics reported by the demo.
+    """
+    provider.get_service(IExternalWeatherService)
+    provider.get_service(SlowExternalWeatherService)
+
+
 def main():
+    # The decorator logs cache HIT/MISS at DEBUG; surface it for the demo only.
+    # Log to stdout so records stay in order with the prints.
+    _enable_cache_logging(sys.stdout)
     print(Colors.format("--- Caching Decorator Example ---", bold=True))
 
     services = ServiceCollection()
@@ -21,6 +47,7 @@ def main():
     services.decorate(IExternalWeatherService, caching_factory)
 
     provider = services.build_service_provider()
+    warmup(provider)
 
     weather_service = provider.get_service(IExternalWeatherService)
     slow_weather_service_instance_for_metrics = provider.get_service(SlowExternalWeatherService) 
@@ -57,6 +84,33 @@ def main():
     make_request("London", "cache likely expired, should be slow")
     make_request("New York", "cache might be warm or cold")
 
+    async def make_request_async(city_name: str) -> float:
+        nonlocal total_requests_to_weather_service
+        total_requests_to_weather_service += 1
+        return await weather_service.get_current_temperature_async(city_name)
+
+    async def concurrent_requests():
+        # Both Paris requests coalesce into one upstream call; Berlin is fetched in parallel.
+        return await asyncio.gather(
+            make_request_async("Paris"), make_request_async("paris"), make_request_async("Berlin")
+        )
+
+    print(f"\n{Colors.format('--- Concurrent async requests (Paris x2, Berlin) ---', Colors.CYAN)}")
+    start_time = time.perf_counter()
+    temperatures = asyncio.run(concurrent_requests())
+    duration = time.perf_counter() - start_time
+    print(f"Reported temperatures: {temperatures} (took {Colors.format(f'{duration:.4f}s', Colors.YELLOW)})")
+
+    # One batch: the cached cities are served together, Tokyo is the only upstream call.
+    batch = ["London", "Paris", "berlin", "Tokyo"]
+    total_requests_to_weather_service += len(batch)
+    batch_label = ", ".join(batch)
+    print(f"\n{Colors.format(f'--- Batch request ({batch_label}) ---', Colors.CYAN)}")
+    start_time = time.perf_counter()
+    temperatures = weather_service.get_many(batch)
+    duration = time.perf_counter() - start_time
+    print(f"Reported temperatures: {temperatures} (took {Colors.format(f'{duration:.4f}s', Colors.YELLOW)})")
+
     print(f"\n{Colors.format('--- Example Complete ---', bold=True)}")
 
     final_api_calls = slow_weather_service_instance_for_metrics.get_api_call_count()
@@ -1,34 +1,58 @@
 # examples/caching_with_decorators/services.py
+import asyncio
 import time
-from abc import ABC, abstractmethod
+from typing import Iterable, List, Protocol
+
+# Base temperature per lower-cased city; anything else uses the default.
+_BASE_TEMPS = {"london": 15.0, "new york": 22.0}
+_DEFAULT_BASE_TEMP = 10.0
+
+class IExternalWeatherService(Protocol):
+    __slots__ = ()
 
-class IExternalWeatherService(ABC):
-    @abstractmethod
     def get_current_temperature(self, city: str) -> float:
         """Simulates fetching current temperature for a city."""
-        pass
+        ...
+
+    async def get_current_temperature_async(self, city: str) -> float:
+        """Non-blocking variant, so several fetches can be in flight at once."""
+        ...
+
+    def get_many(self, cities: Iterable[str]) -> List[float]:
+        """Fetches the temperatures of several cities, in the order given."""
+        ...
 
 class SlowExternalWeatherService(IExternalWeatherService):
     """A simulated weather service that is intentionally slow."""
+    __slots__ = ("_call_count",)
+
     def __init__(self):
         self._call_count = 0
 
     def get_current_temperature(self, city: str) -> float:
         self._call_count += 1
-        print(f"[SlowExternalWeatherService] Fetching temperature for {city}... (Call #{self._call_count})")
+        call_number = self._call_count
+        print(f"[SlowExternalWeatherService] Fetching temperature for {city}... (Call #{call_number})")
         time.sleep(2) # Simulate network latency or expensive computation
-        if city.lower() == "london":
-            temp = 15.0 + self._call_count # Make it change slightly to show cache effect
-            print(f"[SlowExternalWeatherService] Temperature for London: {temp}°C")
-            return temp
-        elif city.lower() == "new york":
-            temp = 22.0 + self._call_count
-            print(f"[SlowExternalWeatherService] Temperature for New York: {temp}°C")
-            return temp
-        else:
-            temp = 10.0 + self._call_count
-            print(f"[SlowExternalWeatherService] Temperature for {city}: {temp}°C")
-            return temp
+        return self._temperature_for(city, call_number)
+
+    async def get_current_temperature_async(self, city: str) -> float:
+        self._call_count += 1
+        # Captured before the await: concurrent fetches bump the counter meanwhile.
+        call_number = self._call_count
+        print(f"[SlowExternalWeatherService] Fetching temperature for {city}... (Call #{call_number})")
+        await asyncio.sleep(2) # Simulated latency no longer blocks other requests
+        return self._temperature_for(city, call_number)
+
+    def get_many(self, cities: Iterable[str]) -> List[float]:
+        # No batch endpoint upstream: one slow call per city.
+        return [self.get_current_temperature(city) for city in cities]
+
+    def _temperature_for(self, city: str, call_number: int) -> float:
+        # Make it change slightly with each call to show the cache effect
+        temp = _BASE_TEMPS.get(city.lower(), _DEFAULT_BASE_TEMP) + call_number
+        print(f"[SlowExternalWeatherService] Temperature for {city}: {temp}°C")
+        return temp
 
     def get_api_call_count(self) -> int:
         return self._call_count 
\ No newline at end of file
@@ -43,10 +43,12 @@ Key moving parts in this file
        A singleton would hold on to whatever backend was injected for the
        *first* request and all tenants would end up in S3 (or whichever
        came first).
+   * ``IBlobStorage`` → **scoped** (the factory runs once per request)
 
 Workflow
 --------
-* Main process builds the root provider.
+* Main process builds the root provider and looks up every tenant's
+  backend class once (``warmup``).
 * Each request:
   1. sets ``_current_tenant``,
   2. opens a *scope* (so scoped services are fresh),
@@ -60,8 +62,10 @@ so you can `python app.py` and see it work instantly.
 
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from contextvars import ContextVar
-from typing import Dict, Callable, Type
+from pathlib import Path
+from typing import Dict, Type
 
 from wd.di import ServiceCollection
 from wd.di.config import Configuration, IConfiguration
@@ -101,26 +105,43 @@ services.add_singleton_factory(
 _current_tenant: ContextVar[str] = ContextVar("tenant")
 
 # Runtime selector -------------------------------------------------
-def _storage_factory(sp, tenant_id: str) -> IBlobStorage:
+_BACKENDS: Dict[str, Type[IBlobStorage]] = {
+    "s3": S3Storage,
+    "azure": AzureBlobStorage,
+    "gcs": GcsStorage,
+}
+
+# Tenant configuration is static for the life of the process, so the
+# backend class is looked up once per tenant and remembered here.
+_TENANT_BACKEND_CACHE: Dict[str, Type[IBlobStorage]] = {}
+
+
+def _backend_for(config: IConfiguration, tenant_id: str) -> Type[IBlobStorage]:
     """
-    Map the tenant's configured backend to the concrete implementation.
+    Looks up the storage class configured for the tenant, once per tenant.
     """
-    backend = sp.get_service(IConfiguration).get(f"tenants:{tenant_id}:backend")
-
-    mapping: Dict[str, Callable[[IClock], IBlobStorage]] = {
-        "s3": lambda clock: S3Storage(clock),
-        "azure": lambda clock: AzureBlobStorage(clock),
-        "gcs": lambda clock: GcsStorage(clock),
-    }
+    cls = _TENANT_BACKEND_CACHE.get(tenant_id)
+    if cls is None:
+        backend = config.get(f"tenants:{tenant_id}:backend")
+        if backend not in _BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}' for tenant {tenant_id}")
+        cls = _TENANT_BACKEND_CACHE[tenant_id] = _BACKENDS[backend]
+    return cls
 
-    if backend not in mapping:
-        raise ValueError(f"Unknown backend '{backend}' for tenant {tenant_id}")
 
-    return mapping[backend](sp.get_service(IClock))
+def _storage_factory(sp, tenant_id: str) -> IBlobStorage:
+    """
+    Map the tenant's configured backend to the concrete implementation.
+    """
+    cls = _backend_for(sp.get_service(IConfiguration), tenant_id)
+    # IClock is a singleton, so this is a cache hit after the first request.
+    return cls(sp.get_service(IClock))
 
 
 # Register abstract factory with DI
-services.add_transient_factory(
+# Scoped: the tenant cannot change within a scope, so the factory runs once
+# per scope and every consumer in that scope shares the same backend.
+services.add_scoped_factory(
     IBlobStorage, lambda sp: _storage_factory(sp, _current_tenant.get())
 )
 
@@ -133,18 +154,39 @@ provider = services.build_service_provider()
 def handle_request(tenant_id: str, filename: str, data: bytes) -> None:
     """
     Simulates an HTTP request boundary: sets the tenant context, creates a
-    DI scope, and processes the ingestion.
+    DI scope, and processes the ingestion. The ingestion service and its
+    backend live only as long as the scope.
     """
     token = _current_tenant.set(tenant_id)
-    with provider.create_scope() as scope:
-        scope.get_service(DataIngestionService).ingest(filename, data)
-    _current_tenant.reset(token)
+    try:
+        with provider.create_scope() as scope:
+            scope.get_service(DataIngestionService).ingest(filename, data)
+    finally:
+        _current_tenant.reset(token)
+
+
+def warmup() -> None:
+    """
+    Looks up the backend class of every configured tenant before the first
+    request arrives, so no request pays for the configuration lookup.
+    """
+    config = provider.get_service(IConfiguration)
+    for tenant_id in config.get("tenants"):
+        _backend_for(config, tenant_id)
 
 
 # ------------------------------------------------------------------
 # 3. Demo run
 # ------------------------------------------------------------------
 if __name__ == "__main__":
-    handle_request("ACME", "acme/lucy.jpg", open("examples/complex_ingest/assets/lucy.jpg", "rb").read())
-    handle_request("Contoso", "contoso/luna.jpg", open("examples/complex_ingest/assets/luna.jpg", "rb").read())
-    handle_request("Globex", "globex/lucy.jpg", open("examples/complex_ingest/assets/lucy.jpg", "rb").read())
+    warmup()
+    jobs = [
+        ("ACME", "acme/lucy.jpg", Path("examples/complex_ingest/assets/lucy.jpg").read_bytes()),
+        ("Contoso", "contoso/luna.jpg", Path("examples/complex_ingest/assets/luna.jpg").read_bytes()),
+        ("Globex", "globex/lucy.jpg", Path("examples/complex_ingest/assets/lucy.jpg").read_bytes()),
+    ]
+    # Uploads are I/O-bound, so threads overlap them. No extra locking is
+    # needed for the tenant id: each worker thread has its own context, which
+    # is exactly why ``_current_tenant`` is a ContextVar.
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        list(executor.map(lambda job: handle_request(*job), jobs))
@@ -6,6 +6,8 @@ from storage.abstractions import IBlobStorage
 
 
 class DataIngestionService:
+    __slots__ = ("_storage",)
+
     def __init__(self, storage: IBlobStorage):
         self._storage = storage
 
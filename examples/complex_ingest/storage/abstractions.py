@@ -2,14 +2,14 @@
 Common interfaces that the rest of the code depends on.
 """
 
-from abc import ABC, abstractmethod
 from typing import Protocol
 
 
-class IBlobStorage(ABC):
+class IBlobStorage(Protocol):
     """Abstract storage service — backend-agnostic."""
 
-    @abstractmethod
+    __slots__ = ()
+
     def upload(self, path: str, data: bytes) -> str:
         """Uploads `data` and returns a URI to the stored object."""
         ...
@@ -18,4 +18,10 @@ class IBlobStorage(ABC):
 class IClock(Protocol):
     """Cross-cutting dependency used for timestamping URIs."""
 
+    __slots__ = ()
+
     def now(self): ...
+
+    def iso_now_cached(self) -> str:
+        """Current time as an ISO string, at whole-second resolution."""
+        ...
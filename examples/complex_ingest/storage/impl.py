@@ -11,7 +11,9 @@ from __future__ import annotations
 
 import datetime
 import os
+import time
 from pathlib import Path
+from typing import Set
 
 from storage.abstractions import IBlobStorage, IClock
 
@@ -21,20 +23,54 @@ from storage.abstractions import IBlobStorage, IClock
 # ---------------------------------------------------------------------------
 
 class UtcClock(IClock):
+    __slots__ = ("_cached_iso",)
+
+    def __init__(self):
+        # (whole second, formatted timestamp) - swapped as one tuple so
+        # concurrent readers never see a mismatched pair.
+        self._cached_iso = (0, "")
+
     def now(self) -> datetime.datetime:
         return datetime.datetime.utcnow()
 
+    def iso_now_cached(self) -> str:
+        sec = int(time.time())
+        cached_sec, cached_iso = self._cached_iso
+        if sec == cached_sec:
+            return cached_iso
+        iso = datetime.datetime.fromtimestamp(sec, datetime.timezone.utc).replace(tzinfo=None).isoformat()
+        self._cached_iso = (sec, iso)
+        return iso
+
 
 # ---------------------------------------------------------------------------
 # Helper: minimal local “object store”
 # ---------------------------------------------------------------------------
 
+# Bucket/container names are read from the environment once, at import.
+_S3_BUCKET = os.getenv("AWS_BUCKET", "demo")
+_AZURE_CONTAINER = os.getenv("AZURE_CONTAINER", "demo")
+_GCP_BUCKET = os.getenv("GCP_BUCKET", "demo")
+
+
+_UPLOAD_ROOT = Path("examples/complex_ingest/uploads")
+
+# Directories already created by this process; mkdir runs once per directory.
+_dir_cache: Set[Path] = set()
+
+
+def _ensure_dir(directory: Path) -> None:
+    if directory not in _dir_cache:
+        directory.mkdir(parents=True, exist_ok=True)
+        _dir_cache.add(directory)
+
+
 def _write_file(root: str, path: str, data: bytes) -> Path:
     """
     Save *data* under ./uploads/<root>/<path> and return the Path object.
     """
-    full_path = Path("examples/complex_ingest/uploads") / root / path
-    full_path.parent.mkdir(parents=True, exist_ok=True)
+    full_path = _UPLOAD_ROOT / root / path
+    _ensure_dir(full_path.parent)
     full_path.write_bytes(data)
     return full_path
 
@@ -48,13 +84,15 @@ class S3Storage(IBlobStorage):
     Pretends to be AWS S3; bucket comes from $AWS_BUCKET or defaults to 'demo'.
     """
 
+    __slots__ = ("_bucket", "_clock")
+
     def __init__(self, clock: IClock):
         self._clock = clock
-        self._bucket = os.getenv("AWS_BUCKET", "demo")
+        self._bucket = _S3_BUCKET
 
     def upload(self, path: str, data: bytes) -> str:
         _write_file(f"s3/{self._bucket}", path, data)
-        ts = self._clock.now().isoformat()
+        ts = self._clock.iso_now_cached()
         return f"s3://{self._bucket}/{path}?ts={ts}"
 
 
@@ -63,13 +101,15 @@ class AzureBlobStorage(IBlobStorage):
     Pretends to be Azure Blob Storage; container from $AZURE_CONTAINER or 'demo'.
     """
 
+    __slots__ = ("_clock", "_container")
+
     def __init__(self, clock: IClock):
         self._clock = clock
-        self._container = os.getenv("AZURE_CONTAINER", "demo")
+        self._container = _AZURE_CONTAINER
 
     def upload(self, path: str, data: bytes) -> str:
         _write_file(f"azure/{self._container}", path, data)
-        ts = self._clock.now().isoformat()
+        ts = self._clock.iso_now_cached()
         return f"azure://{self._container}/{path}?ts={ts}"
 
 
@@ -78,11 +118,13 @@ class GcsStorage(IBlobStorage):
     Pretends to be Google Cloud Storage; bucket from $GCP_BUCKET or 'demo'.
     """
 
+    __slots__ = ("_bucket", "_clock")
+
     def __init__(self, clock: IClock):
         self._clock = clock
-        self._bucket = os.getenv("GCP_BUCKET", "demo")
+        self._bucket = _GCP_BUCKET
 
     def upload(self, path: str, data: bytes) -> str:
         _write_file(f"gcs/{self._bucket}", path, data)
-        ts = self._clock.now().isoformat()
+        ts = self._clock.iso_now_cached()
         return f"gs://{self._bucket}/{path}?ts={ts}"
@@ -1,20 +1,16 @@
-from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Protocol
 from wd.di import ServiceCollection
 from wd.di.config import Configuration, IConfiguration
 
 services = ServiceCollection()
 
 # Define interfaces
-class IEmailService(ABC):
-    @abstractmethod
-    def send_email(self, to: str, subject: str, body: str) -> None:
-        pass
+class IEmailService(Protocol):
+    def send_email(self, to: str, subject: str, body: str) -> None: ...
 
-class IUserService(ABC):
-    @abstractmethod
-    def notify_user(self, user_id: str, message: str) -> None:
-        pass
+class IUserService(Protocol):
+    def notify_user(self, user_id: str, message: str) -> None: ...
 
 
 
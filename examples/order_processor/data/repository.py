@@ -1,10 +1,9 @@
 from domain.interfaces import IOrderRepository
-from infrastructure.logging_service import Logger
 
 class OrderRepository(IOrderRepository):
-    def __init__(self, logger: Logger):
-        self.logger = logger
+    __slots__ = ()
 
     def save_order(self, order):
-        self.logger.log(f"Order saved: {order.order_id}")
         # In a real application, implement database save logic here.
+        # Logging is left to OrderService, which records one trace per order.
+        pass
@@ -1,11 +1,11 @@
-from abc import ABC, abstractmethod
+from typing import Protocol
 
-class IOrderRepository(ABC):
-    @abstractmethod
-    def save_order(self, order):
-        pass
+class IOrderRepository(Protocol):
+    __slots__ = ()
 
-class IOrderService(ABC):
-    @abstractmethod
-    def process_order(self, order):
-        pass
\ No newline at end of file
+    def save_order(self, order): ...
+
+class IOrderService(Protocol):
+    __slots__ = ()
+
+    def process_order(self, order): ...
@@ -1,8 +1,15 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     order_id: str
     item: str
     quantity: int
-    price: float
\ No newline at end of file
+    price: float
+
+
+@dataclass
+class OrderTrace:
+    order_id: str
+    phase: str
+    outcome: str
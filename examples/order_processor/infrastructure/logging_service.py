@@ -1,3 +1,13 @@
+import logging
+
+
 class Logger:
-    def log(self, message: str):
-        print(f"[LOG]: {message}")
\ No newline at end of file
+    def __init__(self):
+        self._logger = logging.getLogger("order_processor")
+
+    def log(self, message: str, *args):
+        # Arguments are interpolated lazily, only if INFO is enabled.
+        self._logger.info("[LOG]: " + message, *args)
+
+    def log_structured(self, trace):
+        self._logger.info("[LOG]: order=%s phase=%s outcome=%s", trace.order_id, trace.phase, trace.outcome)
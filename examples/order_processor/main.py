@@ -1,3 +1,5 @@
+import logging
+
 from domain.interfaces import IOrderRepository, IOrderService
 from wd.di import ServiceCollection
 from wd.di.config import Configuration, IConfiguration
@@ -7,6 +9,13 @@ from data.repository import OrderRepository
 from services.order_service import OrderService
 from presentation.controller import OrderController
 
+# Surface the example's INFO records without reconfiguring the root logger.
+_handler = logging.StreamHandler()
+_handler.setFormatter(logging.Formatter("%(message)s"))
+_logger = logging.getLogger("order_processor")
+_logger.addHandler(_handler)
+_logger.setLevel(logging.INFO)
+
 services = ServiceCollection()
 
 # Configure application settings
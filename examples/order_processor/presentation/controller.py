@@ -2,9 +2,12 @@ from domain.models import Order
 from domain.interfaces import IOrderService
 
 class OrderController:
+    __slots__ = ("_process_order", "order_service")
+
     def __init__(self, order_service: IOrderService):
         self.order_service = order_service
+        # Bound once; submit_order is the request hot path.
+        self._process_order = order_service.process_order
 
     def submit_order(self, order_id, item, quantity, price):
-        order = Order(order_id=order_id, item=item, quantity=quantity, price=price)
-        self.order_service.process_order(order)
+        self._process_order(Order(order_id=order_id, item=item, quantity=quantity, price=price))
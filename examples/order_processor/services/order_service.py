@@ -1,14 +1,20 @@
 from domain.interfaces import IOrderService, IOrderRepository
-from domain.models import Order
+from domain.models import Order, OrderTrace
 from infrastructure.logging_service import Logger
 
 class OrderService(IOrderService):
+    __slots__ = ("logger", "repository")
+
     def __init__(self, repository: IOrderRepository, logger: Logger):
         self.repository = repository
         self.logger = logger
 
     def process_order(self, order: Order):
-        self.logger.log(f"Processing order: {order.order_id}")
         # Business logic: validate order, process payment, etc.
-        self.repository.save_order(order)
-        self.logger.log(f"Order processed: {order.order_id}")
+        # The service owns the trace and emits a single entry per order.
+        try:
+            self.repository.save_order(order)
+        except Exception:
+            self.logger.log_structured(OrderTrace(order.order_id, "save", "failed"))
+            raise
+        self.logger.log_structured(OrderTrace(order.order_id, "save", "processed"))
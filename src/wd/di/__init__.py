@@ -54,25 +54,29 @@ Quick Start:
     ```
 
 This `__init__.py` file re-exports the main public symbols from the various
-modules of the `wd.di` package for easier access.
+modules of the `wd.di` package for easier access. The container and middleware
+symbols are imported lazily on first access to keep `import wd.di` cheap.
 """
-from importlib.metadata import PackageNotFoundError, version
+import importlib
+from typing import TYPE_CHECKING, Any
 
 from wd.di.config import IConfiguration, Options, OptionsBuilder
-from wd.di.container import Scope, ServiceProvider
 from wd.di.exceptions import CircularDecoratorError, InvalidOperationError
 from wd.di.lifetimes import ServiceLifetime
-from wd.di.middleware import (
-    CachingMiddleware,
-    ExceptionHandlerMiddleware,
-    IMiddleware,
-    LoggingMiddleware,
-    MiddlewarePipeline,
-    ValidationMiddleware,
-)
-from wd.di.middleware_di import create_application_builder
 from wd.di.service_collection import ServiceCollection
 
+if TYPE_CHECKING:  # pragma: no cover
+    from wd.di.container import Scope, ServiceProvider
+    from wd.di.middleware import (
+        CachingMiddleware,
+        ExceptionHandlerMiddleware,
+        IMiddleware,
+        LoggingMiddleware,
+        MiddlewarePipeline,
+        ValidationMiddleware,
+    )
+    from wd.di.middleware_di import create_application_builder
+
 __all__ = [
     "CachingMiddleware",
     "CircularDecoratorError",
@@ -93,14 +97,44 @@ __all__ = [
     "create_service_collection",
 ]
 
-try:
-    __version__ = version("wd-di")
-except PackageNotFoundError:
-    __version__ = "0.1.1"
-
+# Symbols imported on first attribute access (PEP 562), so that
+# `from wd.di import ServiceCollection` does not load the container or
+# the middleware modules.
+_LAZY_ATTRIBUTES = {
+    "Scope": "wd.di.container",
+    "ServiceProvider": "wd.di.container",
+    "CachingMiddleware": "wd.di.middleware",
+    "ExceptionHandlerMiddleware": "wd.di.middleware",
+    "IMiddleware": "wd.di.middleware",
+    "LoggingMiddleware": "wd.di.middleware",
+    "MiddlewarePipeline": "wd.di.middleware",
+    "ValidationMiddleware": "wd.di.middleware",
+    "create_application_builder": "wd.di.middleware_di",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolves lazily exported symbols and `__version__` on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name), name)
+    elif name == "__version__":
+        # importlib.metadata is comparatively expensive to import.
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            value = version("wd-di")
+        except PackageNotFoundError:
+            value = "0.1.1"
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # cache: later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
-# Attach extension methods
-ServiceCollection.create_application_builder = create_application_builder
 
 def create_service_collection() -> ServiceCollection:
     """Creates and returns a new, empty [ServiceCollection][wd.di.service_collection.ServiceCollection].
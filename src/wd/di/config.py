@@ -1,12 +1,112 @@
+import functools
 import json
 import os
+import re
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, is_dataclass
 from pathlib import Path
 from typing import Any, Dict, Generic, Optional, Type, TypeVar
 
 T = TypeVar("T")
 
+_CAMEL_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+"""Matches the position before every uppercase ASCII letter except at the start of a key.
+
+Only used for ASCII keys; other keys are split on any `str.isupper()` character.
+"""
+
+
+@functools.lru_cache(maxsize=512)
+def _to_snake_case(key: str) -> str:
+    """Converts a camelCase configuration key to a snake_case attribute name.
+
+    Configuration keys come from a small, fixed vocabulary per application,
+    so results are memoized. They are also interned, so the attribute and
+    keyword lookups they feed compare by identity against the interned
+    field names.
+
+    Args:
+        key: The configuration key, e.g. `"connectionString"`.
+
+    Returns:
+        The snake_case name, e.g. `"connection_string"`.
+    """
+    if key.isascii():
+        return sys.intern(_CAMEL_BOUNDARY.sub("_", key).lower().lstrip("_"))
+    return sys.intern("".join(["_" + c.lower() if c.isupper() else c for c in key]).lstrip("_"))
+
+
+def _flatten(data: Dict[str, Any], prefix: str, out: Dict[str, Any]) -> None:
+    """Records every colon-joined path in `data` (sections and leaves) into `out`.
+
+    Keys that are not strings or that contain a colon themselves are skipped:
+    `Configuration.get` could never reach them by splitting on colons either.
+    """
+    for k, v in data.items():
+        if not isinstance(k, str) or ":" in k:
+            continue
+        path = prefix + k
+        out[path] = v
+        if isinstance(v, dict):
+            _flatten(v, path + ":", out)
+
+
+@functools.lru_cache(maxsize=None)
+def _init_field_names(options_type: type) -> Optional[frozenset]:
+    """Returns the names a dataclass options type accepts in `__init__`.
+
+    Returns `None` for types that are not dataclasses, which are populated
+    attribute by attribute instead.
+    """
+    if not (isinstance(options_type, type) and is_dataclass(options_type)):
+        return None
+    return frozenset(f.name for f in fields(options_type) if f.init)
+
+
+_attribute_names: Dict[type, frozenset] = {}
+"""Attribute names found on the first built instance of each options type."""
+
+
+def _known_attributes(options_type: type, instance: Any) -> Optional[frozenset]:
+    """Returns the attribute names `hasattr` would find on `instance`, cached per type.
+
+    Returns `None` for types that define `__getattr__`, whose attributes cannot
+    be listed up front; callers fall back to `hasattr` for those.
+    """
+    names = _attribute_names.get(options_type)
+    if names is None:
+        if hasattr(options_type, "__getattr__"):
+            return None
+        names = _attribute_names[options_type] = frozenset(dir(instance))
+    return names
+
+
+def _deep_merge(dst: Dict[str, Any], src: Dict[str, Any]) -> None:
+    """Merges `src` into `dst`, combining nested sections instead of replacing them.
+
+    Values from `src` win for leaves. Every section stored in `dst` is a dict
+    created here, so later merges never write into a caller's dictionary.
+    String keys are interned, since the same names recur across sources,
+    sections and options builds. The walk is iterative to avoid a Python
+    call per nesting level.
+    """
+    stack = [(dst, src)]
+    while stack:
+        target, source = stack.pop()
+        for raw_key, value in source.items():
+            key = sys.intern(raw_key) if isinstance(raw_key, str) else raw_key
+            if isinstance(value, dict):
+                section = target.get(key)
+                if not isinstance(section, dict):
+                    section = target[key] = {}
+                stack.append((section, value))
+            else:
+                target[key] = value
+
+
+_MISSING = object()
+
 
 class IConfiguration(ABC):
     """Defines the contract for application configuration.
@@ -15,6 +115,8 @@ class IConfiguration(ABC):
     key-value pairs, and to retrieve specific sections of the configuration
     as new [IConfiguration][wd.di.config.IConfiguration] instances.
     """
+    __slots__ = ()
+
     @abstractmethod
     def get(self, key: str) -> any:
         """Gets a configuration value by key.
@@ -41,6 +143,18 @@ class IConfiguration(ABC):
             or raise an error, depending on the implementation.
         """
 
+    def raw_data(self) -> Dict[str, Any]:
+        """Returns the key/value pairs at this level of the configuration.
+
+        Used by [OptionsBuilder][wd.di.config.OptionsBuilder] to bind options. The default
+        implementation supports custom configurations that store their data in
+        a `_data` attribute and returns an empty dictionary otherwise.
+
+        Returns:
+            A dictionary of the configuration data. Callers must not mutate it.
+        """
+        return getattr(self, "_data", None) or {}
+
 
 class Configuration(IConfiguration):
     """A basic dictionary-backed implementation of [IConfiguration][wd.di.config.IConfiguration].
@@ -50,14 +164,27 @@ class Configuration(IConfiguration):
 
     Attributes:
         _data (Dict[str, Any]): The underlying dictionary holding configuration data.
+        _flat (Optional[Dict[str, Any]]): Every colon-joined key path in `_data` mapped
+            to its value, built on the first `get` so lookups are a single dict
+            access. Sections that are only bound to options never build it.
+        _sections (Dict[str, Configuration]): Section configurations already handed
+            out by `get_section`, keyed by section path.
     """
+    __slots__ = ("_data", "_flat", "_sections")
+
     def __init__(self, data: dict[str, any]):
         """Initializes a new Configuration instance.
 
+        The data is indexed on the first `get`; it should be treated as read-only
+        from then on. Keys added later are still found through the slower
+        hierarchical lookup, but changed values of indexed keys are not seen.
+
         Args:
             data: A dictionary containing the configuration data.
         """
         self._data = data
+        self._flat: Optional[Dict[str, Any]] = None
+        self._sections: Dict[str, "Configuration"] = {}
 
     def get(self, key: str) -> any:
         """Retrieves a configuration value for the given key.
@@ -70,13 +197,39 @@ class Configuration(IConfiguration):
         Returns:
             The value associated with the key if found; otherwise, `None`.
         """
-        keys = key.split(":")
+        if ":" not in key:
+            # Top-level keys need neither the index nor the walk.
+            return self._data.get(key)
+
+        flat = self._flat
+        if flat is None:
+            flat = self._flat = {}
+            _flatten(self._data, "", flat)
+        value = flat.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        # Not indexed (e.g. added after construction): walk the hierarchy,
+        # peeling one segment at a time instead of materialising a split list.
         current = self._data
-        for k in keys:
-            if not isinstance(current, dict) or k not in current:
+        rest = key
+        while True:
+            head, sep, rest = rest.partition(":")
+            if not isinstance(current, dict):
                 return None
-            current = current[k]
-        return current
+            current = current.get(head, _MISSING)
+            if current is _MISSING:
+                return None
+            if not sep:
+                return current
+
+    def raw_data(self) -> Dict[str, Any]:
+        """Returns the underlying configuration dictionary.
+
+        Returns:
+            The dictionary this configuration was created with.
+        """
+        return self._data
 
     def get_section(self, section: str) -> "IConfiguration":
         """Retrieves a subsection of the configuration.
@@ -85,13 +238,18 @@ class Configuration(IConfiguration):
             section: The key of the section to retrieve.
 
         Returns:
-            A new [Configuration][wd.di.config.Configuration] instance representing the requested section.
-            If the section key does not point to a dictionary, an empty
+            A [Configuration][wd.di.config.Configuration] instance representing the requested section.
+            Repeated calls for an existing section return the same instance.
+            If the section key does not point to a dictionary, a new empty
             [Configuration][wd.di.config.Configuration] is returned.
         """
+        cached = self._sections.get(section)
+        if cached is not None:
+            return cached
         value = self.get(section)
         if isinstance(value, dict):
-            return Configuration(value)
+            sub = self._sections[section] = Configuration(value)
+            return sub
         return Configuration({})
 
 
@@ -100,21 +258,31 @@ class ConfigurationBuilder:
 
     This builder allows for a layered configuration approach, where configuration
     data can be loaded from JSON files, environment variables, and dictionaries.
-    Later sources can override values from earlier ones.
+    Later sources can override values from earlier ones; nested sections are
+    merged key by key, so a later source only replaces the leaves it defines.
 
     Attributes:
         _sources (Dict[str, Any]): A dictionary accumulating configuration data
             from all added sources.
+        _environment (Optional[Dict[str, str]]): A snapshot of `os.environ` taken
+            by this builder's first `add_env_variables` call.
+        _environment_by_prefix (Dict[str, Dict[str, str]]): The snapshot filtered
+            by prefix, with the prefix stripped from the keys, per prefix used so far.
     """
+
     def __init__(self):
         """Initializes a new ConfigurationBuilder."""
         self._sources: dict[str, any] = {}
+        self._environment: Optional[Dict[str, str]] = None
+        self._environment_by_prefix: Dict[str, Dict[str, str]] = {}
 
-    def add_json_file(self, path: str) -> "ConfigurationBuilder":
+    def add_json_file(self, path: "str | os.PathLike[str]") -> "ConfigurationBuilder":
         """Adds configuration values from a JSON file.
 
         If the file at the specified path exists, it is read, parsed as JSON,
-        and its contents are merged into the builder's sources.
+        and its contents are merged into the builder's sources. The file is
+        read as bytes, so its UTF-8/16/32 encoding is detected by the parser
+        rather than depending on the platform's default text encoding.
 
         Args:
             path: The file system path to the JSON configuration file.
@@ -122,14 +290,18 @@ class ConfigurationBuilder:
         Returns:
             The [ConfigurationBuilder][wd.di.config.ConfigurationBuilder] instance for fluent chaining.
         """
-        if Path.exists(path):
-            with open(path, "r") as f:
-                self._sources.update(json.load(f))
+        if Path(path).is_file():
+            with open(path, "rb") as f:
+                _deep_merge(self._sources, json.loads(f.read()))
         return self
 
     def add_env_variables(self, prefix: str = "") -> "ConfigurationBuilder":
         """Adds configuration values from environment variables.
 
+        The environment is read once per builder and then served from a
+        snapshot, so adding several prefixes does not decode every variable
+        again. A new builder sees the environment as it is when it is used.
+
         Args:
             prefix: An optional prefix. If provided, only environment variables
                 starting with this prefix will be added. The prefix itself will be
@@ -138,19 +310,25 @@ class ConfigurationBuilder:
         Returns:
             The [ConfigurationBuilder][wd.di.config.ConfigurationBuilder] instance for fluent chaining.
         """
-        for key, value in os.environ.items():
-            if prefix and not key.startswith(prefix):
-                continue
-            config_key = key
-            if prefix:
-                config_key = key[len(prefix) :]
-            self._sources[config_key] = value
+        environment = self._environment
+        if environment is None:
+            environment = self._environment = {sys.intern(key): value for key, value in os.environ.items()}
+        if prefix:
+            filtered = self._environment_by_prefix.get(prefix)
+            if filtered is None:
+                n = len(prefix)
+                filtered = self._environment_by_prefix[prefix] = {
+                    sys.intern(key[n:]): value for key, value in environment.items() if key.startswith(prefix)
+                }
+            environment = filtered
+        self._sources.update(environment)
         return self
 
     def add_dictionary(self, dictionary: Dict[str, Any]) -> "ConfigurationBuilder":
         """Adds configuration values from a dictionary.
 
-        The provided dictionary's key-value pairs are merged into the builder's sources.
+        The provided dictionary's key-value pairs are merged into the builder's
+        sources. The dictionary itself is not modified by later sources.
 
         Args:
             dictionary: A dictionary containing configuration key-value pairs.
@@ -158,7 +336,7 @@ class ConfigurationBuilder:
         Returns:
             The [ConfigurationBuilder][wd.di.config.ConfigurationBuilder] instance for fluent chaining.
         """
-        self._sources.update(dictionary)
+        _deep_merge(self._sources, dictionary)
         return self
 
     def build(self) -> IConfiguration:
@@ -198,6 +376,8 @@ class Options(Generic[T]):
     Generics:
         T: The type of the options class being wrapped.
     """
+    __slots__ = ("_value",)
+
     def __init__(self, value: T):
         """Initializes a new Options instance.
 
@@ -226,6 +406,8 @@ class OptionsBuilder(Generic[T]):
     Generics:
         T: The type of the options class to be built.
     """
+    __slots__ = ("_configuration", "_options_type", "_section")
+
     def __init__(self, options_type: Type[T]):
         """Initializes a new OptionsBuilder.
 
@@ -262,29 +444,47 @@ class OptionsBuilder(Generic[T]):
         from the bound [IConfiguration][wd.di.config.IConfiguration] (and section, if specified).
         It handles mapping of camelCase configuration keys to snake_case attribute names.
 
+        Every call returns a new instance; `ServiceCollection.configure`
+        registers the result as a singleton, so it is built once per provider.
+
         Returns:
             An instance of the options class `T`, populated with values from the
             configuration if available.
         """
         if self._configuration is None:
             return self._options_type()
+        return self._bind()
 
+    def _bind(self) -> T:
+        """Creates the options instance and populates it from the bound configuration."""
         config_section = self._configuration
         if self._section:
             config_section = self._configuration.get_section(self._section)
 
-        instance = self._options_type()
-        config_dict = {}
-
-        if hasattr(config_section, "_data"):
-            config_dict = config_section._data
+        config_dict = config_section.raw_data()
+        init_names = _init_field_names(self._options_type)
+        if init_names is None:
+            instance = self._options_type()
+            remaining = config_dict.items()
+        else:
+            # Dataclasses receive their configured fields as constructor
+            # arguments, so defaults are not built only to be overwritten.
+            kwargs: Dict[str, Any] = {}
+            remaining = []
+            for key, value in config_dict.items():
+                snake_key = _to_snake_case(key)
+                if snake_key in init_names:
+                    kwargs[snake_key] = value
+                else:
+                    remaining.append((key, value))
+            instance = self._options_type(**kwargs)
+
+        known = _known_attributes(self._options_type, instance)
 
         # Convert camelCase to snake_case for property names
-        for key, value in config_dict.items():
-            snake_key = "".join(
-                ["_" + c.lower() if c.isupper() else c for c in key]
-            ).lstrip("_")
-            if hasattr(instance, snake_key):
+        for key, value in remaining:
+            snake_key = _to_snake_case(key)
+            if (snake_key in known) if known is not None else hasattr(instance, snake_key):
                 setattr(instance, snake_key, value)
 
         return instance
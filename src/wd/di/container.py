@@ -23,35 +23,77 @@ for compatibility with older import paths.
 from __future__ import annotations
 
 import contextvars
+import functools
 import inspect
+import logging
+import sys
 import threading
-from typing import Any, Dict, List, Mapping, Sequence, Type, TypeVar, Union, get_type_hints, overload
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_type_hints,
+    overload,
+)
 
-from .descriptors import ServiceDescriptor
-from .exceptions import CircularDecoratorError, InvalidOperationError
+from .descriptors import DecoratorFactory, ServiceDescriptor
+from .exceptions import CircularDecoratorError, InvalidOperationError, _unresolvable_parameter_message
 from .lifetimes import ServiceLifetime
 
 __all__ = ["Scope", "ServiceProvider"]
 
 T = TypeVar("T")
 
+_logger = logging.getLogger(__name__)
+
+_MISSING = object()
+"""Sentinel for cache misses, so a single `dict.get` serves as both test and fetch."""
+
 # --------------------------------------------------------------------------- #
 # Task-local resolution stack (dependency & decorator cycles)
 # --------------------------------------------------------------------------- #
 
-_resolution_stack: contextvars.ContextVar[List[str]] = contextvars.ContextVar(
-    "wd_di_resolution_stack", default=[]
+_resolution_stack: contextvars.ContextVar[Optional[Tuple[List[object], Set[int]]]] = contextvars.ContextVar(
+    "wd_di_resolution_stack", default=None
 )
-"""A context variable holding a list of service keys currently being resolved.
+"""A context variable holding the services and decorators currently being resolved.
 
-This stack is used to detect circular dependencies during service resolution.
-Each string in the list is a unique key representing a service or decorator
-(see `_key` function). Before resolving a service or applying a decorator,
-its key is added to this stack. If the key is already present, a circular
-dependency is detected.
+The value is a `(stack, active)` pair: `stack` lists the service types and
+decorator callables in resolution order, and `active` holds their `id()`s as
+a set so cycle checks are a single membership test. Before resolving a
+service or applying a decorator, it is pushed onto both. If it is already
+active, a circular dependency is detected. Readable names (see `_key`) are
+only produced when an error is raised.
+
+Both containers are mutated in place; see `_resolution_frames` for when a
+new pair is installed.
 """
 
 
+def _resolution_frames() -> Tuple[List[object], Set[int]]:
+    """Returns the `(stack, active)` pair for the current resolution.
+
+    A top-level resolution (nothing on the stack yet) installs a fresh pair,
+    so threads and copied contexts never share one; nested resolutions reuse
+    it without touching the context variable again.
+    """
+    frames = _resolution_stack.get()
+    if frames is None or not frames[0]:
+        frames = ([], set())
+        _resolution_stack.set(frames)
+    return frames
+
+
 class ServiceProvider:
     """The runtime dependency injection container that resolves service instances.
 
@@ -66,15 +108,36 @@ class ServiceProvider:
             service types to their corresponding [ServiceDescriptor][wd.di.descriptors.ServiceDescriptor] objects.
         _singleton_cache (Dict[Type[Any], Any]): A cache for singleton service
             instances. Shared between the root provider and all its scopes.
-        _singleton_lock (threading.RLock): A reentrant lock to synchronize access
-            to the `_singleton_cache`.
+        _factory_cache (Dict[Type[Any], Callable[[ServiceProvider], Any]]): Compiled
+            per-service factories (see `_compile_factory`). Shared between the root
+            provider and all its scopes.
+        _resolver_cache (Dict[Type[Any], Callable[[ServiceProvider], Any]]): Per-service
+            resolvers specialised for the service's lifetime (see `_resolver_for`).
+            Shared between the root provider and all its scopes.
+        _singleton_lock (threading.RLock): Serialises the first build of every
+            singleton, so racing threads construct each one once. Shared between
+            the root provider and all its scopes.
         _scoped_cache (Dict[Type[Any], Any]): A cache for scoped service instances.
             Each scope (including the root provider, which acts as its own scope)
             has its own independent scoped cache.
-        _disposables (List[Any]): A list of disposable service instances created
-            within the current scope. These are disposed of when the scope itself
-            is disposed.
+        _disposables (List[Tuple[Any, str]]): The disposable service instances
+            created within the current scope, each paired with the name of its
+            cleanup method. These are disposed of when the scope itself is disposed.
     """
+    # A scope is created per unit of work (often per request), so instances
+    # carry no __dict__.
+    __slots__ = (
+        "__weakref__",
+        "_descriptors",
+        "_disposables",
+        "_factory_cache",
+        "_resolver_cache",
+        "_root",
+        "_scoped_cache",
+        "_singleton_cache",
+        "_singleton_lock",
+    )
+
     # NOTE: 'services' can be a mapping (old API) **or** a list (new API)
     def __init__(
         self,
@@ -99,27 +162,39 @@ class ServiceProvider:
         # ------------------------------------------------------------------ #
         # Root vs scope initialisation
         # ------------------------------------------------------------------ #
+        # No per-descriptor work happens here: factories are compiled on the
+        # first resolution of each service (see `_factory_for`).
         if _root is None:  # root provider (publicly constructed)
             self._root: "ServiceProvider" = self
 
             # Accept both old dict-based and new list-based descriptor stores.
+            # Keys are the service types themselves rather than `id(type)`:
+            # class hashing is already identity-based, and generic aliases such
+            # as `Options[AppConfig]` compare by value, so an equal alias built
+            # elsewhere must still find the registration. Only the first
+            # resolution of a type reads this dict; afterwards `get_service`
+            # goes through `_resolver_cache`, which is keyed the same way.
             if isinstance(services, Mapping):
                 self._descriptors: Dict[Type[Any], ServiceDescriptor[Any]] = dict(services)
             else:
                 self._descriptors = {d.service_type: d for d in services}
 
             self._singleton_cache: Dict[Type[Any], Any] = {}
+            self._factory_cache: Dict[Type[Any], Callable[["ServiceProvider"], Any]] = {}
+            self._resolver_cache: Dict[Type[Any], Callable[["ServiceProvider"], Any]] = {}
             self._singleton_lock = threading.RLock()
         else:  # scoped provider (private constructor via create_scope)
             self._root = _root
             # Re-use the root's descriptors & singleton cache.
             self._descriptors = _root._descriptors
             self._singleton_cache = _root._singleton_cache
+            self._factory_cache = _root._factory_cache
+            self._resolver_cache = _root._resolver_cache
             self._singleton_lock = _root._singleton_lock
 
         # Each scope (including root) gets its *own* scoped cache & disposables.
         self._scoped_cache: Dict[Type[Any], Any] = {}
-        self._disposables: List[Any] = []
+        self._disposables: List[Tuple[Any, str]] = []
 
     # ------------------------------------------------------------------ #
     # Public API – resolve service
@@ -151,34 +226,110 @@ class ServiceProvider:
             RuntimeError: If a general circular dependency (not involving decorators,
                 or not identifiable as such by the decorator cycle check) is detected.
         """
+        resolve = self._resolver_cache.get(service_type)
+        if resolve is None:
+            resolve = self._resolver_for(service_type)
+        return resolve(self)
+
+    # -- helper: lifetime-specialised resolvers --------------------------- #
+    def _resolver_for(self, service_type: Type[Any]) -> Callable[["ServiceProvider"], Any]:
+        """Returns the resolver for `service_type`, building it on first use.
+
+        Each resolver only carries the checks its lifetime needs, so resolving
+        a cached singleton or scoped service is one dict lookup after the
+        resolver itself is found.
+
+        Args:
+            service_type: The type of the service to resolve.
+
+        Returns:
+            A callable that resolves the service from the provider passed to it.
+
+        Raises:
+            KeyError: If no service is registered for `service_type`.
+        """
         desc = self._descriptors.get(service_type)
         if desc is None:
             raise KeyError(f"No service registered for type {service_type!r}.")
 
-        # ---------- fast path: cache lookup ----------
+        # The service type and decorators themselves are the stack frames;
+        # `id()` is taken once here for the membership set.
+        frame = service_type
+        decorators = tuple((deco, id(deco)) for deco in reversed(desc.decorators))
+        build = ServiceProvider._build
         if desc.lifetime is ServiceLifetime.SINGLETON:
-            try:
-                return self._singleton_cache[service_type]
-            except KeyError:
-                pass  # miss → build
+            cached = self._singleton_cache.get
+            resolvers = self._resolver_cache
+            # Guards the first build only, so racing threads construct the
+            # singleton once. One re-entrant lock per root provider rather than
+            # per service: a thread building nested singletons never waits on
+            # another thread, so a cycle entered from opposite ends is reported
+            # by `_build` in each thread instead of deadlocking them.
+            lock = self._singleton_lock
+
+            def resolve(sp: "ServiceProvider") -> Any:
+                instance = cached(service_type, _MISSING)
+                if instance is _MISSING:
+                    with lock:
+                        instance = cached(service_type, _MISSING)
+                        if instance is _MISSING:
+                            instance = build(sp, service_type, desc, frame, decorators)
+                # Once published, the singleton never changes: later calls
+                # skip the cache lookup and return it directly.
+                resolvers[service_type] = lambda _sp: instance
+                return instance
+
         elif desc.lifetime is ServiceLifetime.SCOPED:
-            # Check if attempting to resolve a scoped service from the root provider
-            if self._root is self: # We are the root provider
-                raise InvalidOperationError(
-                    "Cannot resolve scoped service from the root provider. "
-                    "Please create a scope using 'create_scope()' and resolve it from the scope."
-                )
-            try:
-                return self._scoped_cache[service_type]
-            except KeyError:
-                pass
-        # Transient → always build.
 
+            def resolve(sp: "ServiceProvider") -> Any:
+                # Scoped services cannot come from the root provider.
+                if sp._root is sp:
+                    raise InvalidOperationError(
+                        "Cannot resolve scoped service from the root provider. "
+                        "Please create a scope using 'create_scope()' and resolve it from the scope."
+                    )
+                instance = sp._scoped_cache.get(service_type, _MISSING)
+                if instance is _MISSING:
+                    instance = build(sp, service_type, desc, frame, decorators)
+                return instance
+
+        else:  # Transient → always build.
+
+            def resolve(sp: "ServiceProvider") -> Any:
+                return build(sp, service_type, desc, frame, decorators)
+
+        return self._resolver_cache.setdefault(service_type, resolve)
+
+    def _build(
+        self,
+        service_type: Type[Any],
+        desc: ServiceDescriptor[Any],
+        frame: object,
+        decorators: Tuple[Tuple[DecoratorFactory, int], ...],
+    ) -> Any:
+        """Creates an instance of `desc` under cycle detection and caches it by lifetime.
+
+        Args:
+            service_type: The requested type, used as the cache key.
+            desc: The [ServiceDescriptor][wd.di.descriptors.ServiceDescriptor] of the service to build.
+            frame: The resolution-stack frame of `service_type`.
+            decorators: `(decorator, id)` pairs in application order
+                (last registered first).
+
+        Returns:
+            The new instance, or for singletons the instance another thread
+            stored first.
+
+        Raises:
+            [CircularDecoratorError][wd.di.exceptions.CircularDecoratorError]: If a circular dependency involving
+                decorators is detected.
+            RuntimeError: If a general circular dependency is detected.
+        """
         # ---------- circular dependency guard ----------
-        stack = _resolution_stack.get()
-        frame = _key(service_type)
+        stack, active = _resolution_frames()
+        frame_id = id(frame)
 
-        if frame in stack:
+        if frame_id in active:
             idx_frame_in_stack = stack.index(frame)
 
             # Check if this is a decorator-induced cycle:
@@ -187,37 +338,44 @@ class ServiceProvider:
             # Stack would be: [..., S_key, D_key_for_S, ... (possibly other things if D calls other services)],
             # and now 'frame' (S_key) is being requested again.
             # 'desc' is the ServiceDescriptor for 'service_type' (whose key is 'frame').
-            if desc and desc.decorators and (idx_frame_in_stack + 1) < len(stack):
+            if decorators and (idx_frame_in_stack + 1) < len(stack):
                 item_after_frame_in_stack = stack[idx_frame_in_stack + 1]
-                # These are the keys of decorators registered for the current service 'frame'.
-                decorator_keys_for_this_service = {_key(deco_factory) for deco_factory in desc.decorators}
+                # These are the ids of decorators registered for the current service 'frame'.
+                decorator_ids_for_this_service = {deco_id for _, deco_id in decorators}
 
-                if item_after_frame_in_stack in decorator_keys_for_this_service:
+                if id(item_after_frame_in_stack) in decorator_ids_for_this_service:
                     # The cycle is: frame -> item_after_frame (a decorator for frame) -> ... -> frame (current request)
                     # This indicates the decorator 'item_after_frame_in_stack' (or something it called)
                     # is trying to resolve 'frame' again.
-                    cycle_path = stack[idx_frame_in_stack:] + [frame]
+                    cycle_path = [_key(f) for f in stack[idx_frame_in_stack:]] + [_key(frame)]
                     raise CircularDecoratorError(cycle_path)
 
             # If not a decorator cycle identified above, then it's a general circular dependency.
-            cycle_path = stack[idx_frame_in_stack:] + [frame]
+            cycle_path = [_key(f) for f in stack[idx_frame_in_stack:]] + [_key(frame)]
             raise RuntimeError("Circular dependency detected: " + " -> ".join(cycle_path))
 
         stack.append(frame)
-        _resolution_stack.set(stack)
+        active.add(frame_id)
         try:
-            instance = self._create_instance(desc)
+            if decorators:
+                instance = self._create_instance(desc, decorators)
+            else:  # the common case: just the compiled factory
+                instance = self._factory_for(desc)(self)
         finally:
             stack.pop()
+            active.discard(frame_id)
 
         # ---------- lifetime caching ----------
         if desc.lifetime is ServiceLifetime.SINGLETON:
-            with self._singleton_lock:
-                if service_type not in self._singleton_cache:  # double-checked
-                    self._singleton_cache[service_type] = instance
+            # The resolver's lock makes this the only build of the singleton.
+            self._singleton_cache[service_type] = instance
         elif desc.lifetime is ServiceLifetime.SCOPED:
-            self._scoped_cache[service_type] = instance
-            self._try_register_disposable(instance)
+            # Same race within one scope: only the stored instance is
+            # registered for disposal at scope end; a duplicate is dropped.
+            cached = self._scoped_cache.setdefault(service_type, instance)
+            if cached is instance:
+                self._try_register_disposable(instance)
+            instance = cached
         # Transient → caller owns the object.
 
         return instance  # type: ignore[return-value]
@@ -254,17 +412,8 @@ class ServiceProvider:
         However, singletons are managed by the root and are not disposed of via
         this scope disposal mechanism.
         """
-        for inst in self._disposables:
-            if hasattr(inst, "dispose") and callable(inst.dispose):
-                try:
-                    inst.dispose()
-                except Exception as exc:
-                    print(f"Error disposing {inst}: {exc}")
-            elif hasattr(inst, "close") and callable(inst.close):
-                try:
-                    inst.close()
-                except Exception as exc:
-                    print(f"Error closing {inst}: {exc}")
+        for inst, name in self._disposables:
+            _call_disposer(inst, name)
         self._disposables.clear()
         self._scoped_cache.clear()
 
@@ -293,19 +442,25 @@ class ServiceProvider:
     # ------------------------------------------------------------------ #
     # Internal helpers
     # ------------------------------------------------------------------ #
-    def _create_instance(self, desc: ServiceDescriptor[Any]) -> Any:
+    def _create_instance(
+        self,
+        desc: ServiceDescriptor[Any],
+        decorators: Tuple[Tuple[DecoratorFactory, int], ...],
+    ) -> Any:
         """Creates an instance of a service based on its descriptor and applies decorators.
 
         This internal method handles the core logic of instantiation:
         1. If a factory is provided in the [ServiceDescriptor][wd.di.descriptors.ServiceDescriptor], it's called.
         2. Otherwise, the `implementation_type` is instantiated, with its own
-           dependencies resolved via constructor injection (see `_construct_via_type_hints`).
+           dependencies resolved via constructor injection (see `_compile_factory`).
         3. Any registered decorators are applied in reverse order of registration
            (so the last registered decorator becomes the outermost wrapper).
            Circular decorator dependencies are checked during this phase.
 
         Args:
             desc: The [ServiceDescriptor][wd.di.descriptors.ServiceDescriptor] for the service to create.
+            decorators: `desc.decorators` as `(decorator, id)` pairs in
+                application order, precomputed by `_resolver_for`.
 
         Returns:
             The fully constructed (and potentially decorated) service instance.
@@ -314,134 +469,382 @@ class ServiceProvider:
             [CircularDecoratorError][wd.di.exceptions.CircularDecoratorError]: If a cycle is detected during
                 decorator application.
         """
-        # Build inner service
-        if desc.factory is not None:
-            inner = desc.factory(self)
-        else:  # constructor injection via type hints
-            impl = desc.implementation_type
-            assert impl is not None
-            inner = self._construct_via_type_hints(impl)
+        # Build inner service (factory or compiled constructor injection)
+        inner = self._factory_for(desc)(self)
 
         # Apply decorators (outermost == last registered)
-        if desc.decorators:
-            stack = _resolution_stack.get()
-            for deco in reversed(desc.decorators):
-                deco_frame = _key(deco)
-                if deco_frame in stack:
-                    cycle = stack[stack.index(deco_frame) :] + [deco_frame]
+        if decorators:
+            stack, active = _resolution_frames()
+            for deco, deco_id in decorators:
+                if deco_id in active:
+                    cycle = [_key(f) for f in stack[stack.index(deco) :]] + [_key(deco)]
                     raise CircularDecoratorError(cycle)
 
-                stack.append(deco_frame)
-                _resolution_stack.set(stack)
+                stack.append(deco)
+                active.add(deco_id)
                 try:
                     inner = deco(self, inner)
                 finally:
                     stack.pop()
+                    active.discard(deco_id)
 
         return inner
 
-    # -- helper: constructor injection ---------------------------------- #
-    def _construct_via_type_hints(self, cls: Type[Any]) -> Any:
-        """Constructs an instance of `cls` by resolving its constructor dependencies.
+    # -- helper: compiled factories -------------------------------------- #
+    def _factory_for(self, desc: ServiceDescriptor[Any]) -> Callable[["ServiceProvider"], Any]:
+        """Returns the compiled factory for `desc`, building it on first use.
 
-        This method inspects the `__init__` method of the given class, resolves
-        the type hints of its parameters by calling `get_service` for each, and
-        then instantiates the class with these resolved dependencies.
+        Compiled factories are stored in `_factory_cache`, which is shared by
+        the root provider and all of its scopes, so each service type is
+        compiled at most once per container.
 
-        It handles classes with no explicit `__init__` or an `__init__` inherited
-        directly from `object`.
+        Args:
+            desc: The [ServiceDescriptor][wd.di.descriptors.ServiceDescriptor] to compile.
+
+        Returns:
+            A callable taking the resolving [ServiceProvider][wd.di.container.ServiceProvider] and
+            returning the undecorated service instance.
+        """
+        factory = self._factory_cache.get(desc.service_type)
+        if factory is None:
+            factory = self._compile_factory(desc)
+            self._factory_cache[desc.service_type] = factory
+        return factory
+
+    def _compile_factory(self, desc: ServiceDescriptor[Any]) -> Callable[["ServiceProvider"], Any]:
+        """Builds the callable that creates the undecorated instance for `desc`.
+
+        Registered factories are used as-is. For implementation types the
+        constructor is introspected once (see `_constructor_plan`) and turned
+        into a specialised function (see `_compile_constructor`), so later
+        resolutions only resolve the dependencies and call the constructor.
+        The compiled function does not depend on the provider and is shared
+        by every provider that constructs the same class (see `_constructor_for`).
+
+        Args:
+            desc: The [ServiceDescriptor][wd.di.descriptors.ServiceDescriptor] to compile.
+
+        Returns:
+            A callable taking the resolving [ServiceProvider][wd.di.container.ServiceProvider].
+        """
+        if desc.factory is not None:
+            return desc.factory
+
+        impl = desc.implementation_type
+        assert impl is not None
+        return _constructor_for(impl)
+
+    # -- helper: constructor injection ---------------------------------- #
+    @staticmethod
+    def _constructor_plan(impl: Type[Any]) -> Tuple[Tuple[str, Type[Any]], ...]:
+        """Computes the constructor-injection plan for `impl`.
+
+        This method inspects the `__init__` method of the given class and
+        returns the `(parameter name, service type)` pairs that must be
+        resolved to instantiate it. `*args` and `**kwargs` are skipped, so
+        classes without an explicit `__init__` yield an empty plan.
 
         Type hints are resolved using `get_type_hints`, providing the class's
         module globals to help with forward references.
 
         Args:
-            cls: The class type to instantiate.
+            impl: The class type to plan construction for.
 
         Returns:
-            An instance of `cls`.
+            A tuple of `(parameter name, service type)` pairs in declaration order.
 
         Raises:
-            TypeError: If a constructor parameter cannot be resolved or if there's
-                an issue with type hint resolution (e.g., unresolvable forward reference
-                not caught as a direct circular dependency by `get_service`).
-            NameError: Potentially from `get_type_hints` if a forward reference
-                cannot be resolved within the class's module context and isn't a
-                service type itself (though `get_service` would usually catch this earlier).
+            TypeError: If a constructor parameter has no resolvable type annotation.
+            RuntimeError: If type hint resolution fails with a `NameError`
+                (e.g., an unresolvable forward reference in a circular dependency).
         """
-        # Get the constructor, __init__ might be inherited from object
-        # For dataclasses or classes without explicit __init__, inspect.signature directly on class might be better
-        # but __init__ is standard.
-        constructor_to_inspect = cls.__init__
-        if constructor_to_inspect is object.__init__ and not hasattr(cls, '__init__'): # Handle classes with no explicit __init__
-             # If it's object.__init__ and there's no __init__ on the class itself (e.g. simple class Foo: pass)
-             # then there are no parameters to inject.
-             if not [p for p_name, p in inspect.signature(cls).parameters.items() if p.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD]:
-                 return cls()
-
-
-        sig = inspect.signature(constructor_to_inspect)
+        names = _parameter_names_for(impl)
 
-        # Resolve type hints, providing globals and locals from the class's module
-        # to help resolve forward references.
+        # Resolve type hints (cached per class), providing the class's module
+        # globals to help resolve forward references.
         try:
-            # Get the module where the class `cls` is defined.
-            module = inspect.getmodule(cls)
-            if module is None:
-                # Fallback if module cannot be determined (e.g. dynamically created classes)
-                # This might limit forward reference resolution.
-                resolved_hints = get_type_hints(constructor_to_inspect)
-            else:
-                resolved_hints = get_type_hints(constructor_to_inspect, module.__dict__)
+            resolved_hints = _type_hints_for(impl)
         except NameError as e:
             # This is where the test expects the failure for unresolved forward reference in a cycle
-            stack = _resolution_stack.get() # Get current resolution stack for error message
+            frames = _resolution_stack.get()  # Current resolution stack for the error message
+            stack = [_key(f) for f in frames[0]] if frames else []
             # Ensure the current class being constructed is part of the reported stack if not already
-            cls_key = _key(cls)
-            if not stack or stack[-1] != cls_key: # Add if not already the last one
-                effective_stack_for_error = stack + [cls_key]
+            impl_key = _key(impl)
+            if not stack or stack[-1] != impl_key: # Add if not already the last one
+                effective_stack_for_error = stack + [impl_key]
             else:
                 effective_stack_for_error = stack
 
             raise RuntimeError(
-                f"Failed to resolve dependencies for {cls.__qualname__} "
+                f"Failed to resolve dependencies for {impl.__qualname__} "
                 f"due to NameError (potential forward reference in a circular dependency): {e}. "
                 f"Resolution stack: {effective_stack_for_error}"
             ) from e
 
-        kwargs: Dict[str, Any] = {}
-        for name, param in sig.parameters.items():
-            if name == "self":
-                continue
-
+        plan: List[Tuple[str, Type[Any]]] = []
+        for name in names:
             actual_param_type = resolved_hints.get(name)
 
             if actual_param_type is None:
-                # Parameter not in resolved_hints, could be *args, **kwargs, or missing annotation
-                if param.kind == inspect.Parameter.VAR_POSITIONAL or \
-                   param.kind == inspect.Parameter.VAR_KEYWORD:
-                    continue # Skip *args, **kwargs
-                raise TypeError(
-                    f"Cannot resolve constructor parameter '{name}' for {cls.__qualname__}; "
-                    f"missing type annotation or type could not be resolved."
-                )
-
-            kwargs[name] = self.get_service(actual_param_type)
-        return cls(**kwargs)
+                raise TypeError(_unresolvable_parameter_message(impl, name))
+
+            plan.append((name, actual_param_type))
+        return tuple(plan)
 
     # -- helper: register disposables ----------------------------------- #
     def _try_register_disposable(self, instance: Any) -> None:
         """Registers an instance for disposal if it has a `dispose` or `close` method.
 
         This method checks if the provided `instance` has a callable `dispose`
-        attribute or a callable `close` attribute. If so, the instance is added
-        to the `_disposables` list for the current scope, ensuring it will be
-        cleaned up when the scope is disposed.
+        or `close` (see `_disposer_for`, which caches the answer per class
+        where it can). If so, the instance and the method name are added to
+        the `_disposables` list for the current scope, ensuring it will be
+        cleaned up when the scope is disposed without probing it again.
 
         Args:
             instance: The service instance to check and potentially register.
         """
-        if (hasattr(instance, "dispose") and callable(instance.dispose)) or (hasattr(instance, "close") and callable(instance.close)):
-            self._disposables.append(instance)
+        name = _disposer_for(instance)
+        if name is not None:
+            self._disposables.append((instance, name))
+
+
+# ---------------------------------------------------------------------- #
+# Helpers – constructor introspection (cached per class)
+# ---------------------------------------------------------------------- #
+
+_C = TypeVar("_C")
+
+
+def _weak_class_cache(compute: Callable[[type], _C]) -> Callable[[type], _C]:
+    """Memoize a per-class computation without keeping the class alive.
+
+    Results live in a `weakref.WeakKeyDictionary`, so classes created at
+    runtime (per test, per tenant) are released once nothing else uses them.
+    Exceptions are not cached. The wrapper exposes `cache_clear()`.
+
+    Args:
+        compute: The function computing the value for a class.
+
+    Returns:
+        The memoizing wrapper.
+    """
+    cache: "weakref.WeakKeyDictionary[type, _C]" = weakref.WeakKeyDictionary()
+
+    @functools.wraps(compute)
+    def cached(cls: type) -> _C:
+        try:
+            return cache[cls]
+        except KeyError:
+            pass
+        value = cache[cls] = compute(cls)
+        return value
+
+    cached.cache_clear = cache.clear  # type: ignore[attr-defined]
+    return cached
+
+
+@_weak_class_cache
+def _signature_for(cls: Type[Any]) -> inspect.Signature:
+    """Return the signature of `cls.__init__`, computed once per class.
+
+    Class constructors do not change at runtime, so the (comparatively
+    expensive) `inspect.signature` call is memoized. Use
+    `_signature_for.cache_clear()` to reset it in tests.
+
+    Args:
+        cls: The class whose constructor should be inspected.
+
+    Returns:
+        The `inspect.Signature` of the class's `__init__` method.
+    """
+    return inspect.signature(cls.__init__)
+
+
+@_weak_class_cache
+def _parameter_names_for(cls: Type[Any]) -> Tuple[str, ...]:
+    """Return the injectable parameter names of `cls.__init__`, computed once per class.
+
+    Plain Python constructors are read straight from their code object;
+    `co_varnames` starts with the positional and keyword-only parameters,
+    so `*args` and `**kwargs` are excluded by slicing. Constructors without
+    a code object (e.g. `object.__init__`), wrapped by a decorator or carrying
+    an explicit `__signature__` fall back to `_signature_for`.
+
+    Args:
+        cls: The class whose constructor should be inspected.
+
+    Returns:
+        The parameter names other than `self`, `*args` and `**kwargs`, in
+        declaration order.
+    """
+    constructor = cls.__init__
+    code = getattr(constructor, "__code__", None)
+    if code is None or hasattr(constructor, "__wrapped__") or hasattr(constructor, "__signature__"):
+        return tuple(
+            name
+            for name, param in _signature_for(cls).parameters.items()
+            if name != "self"
+            and param.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+        )
+    names = code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+    return tuple(name for name in names if name != "self")
+
+
+@_weak_class_cache
+def _type_hints_for(cls: Type[Any]) -> Dict[str, Any]:
+    """Return the resolved type hints of `cls.__init__`, computed once per class.
+
+    The class's module globals are supplied so forward references can be
+    resolved. A `NameError` from an unresolvable forward reference is not
+    cached, so a later call can succeed once the name exists. Use
+    `_type_hints_for.cache_clear()` to reset the cache in tests.
+
+    Args:
+        cls: The class whose constructor hints should be resolved.
+
+    Returns:
+        A mapping of parameter names to resolved types. Callers must not mutate it.
+
+    Raises:
+        NameError: If a forward reference cannot be resolved.
+    """
+    constructor = cls.__init__
+    # A direct `sys.modules` lookup; `inspect.getmodule` may scan every
+    # loaded module's file name when `__module__` is not importable.
+    module = sys.modules.get(cls.__module__)
+    if module is None:
+        # Fallback if module cannot be determined (e.g. dynamically created classes)
+        # This might limit forward reference resolution.
+        return get_type_hints(constructor)
+    return get_type_hints(constructor, module.__dict__)
+
+
+_constructors: "weakref.WeakKeyDictionary[type, weakref.ref[Callable[[ServiceProvider], Any]]]" = (
+    weakref.WeakKeyDictionary()
+)
+"""Per class: a weak reference to its compiled constructor.
+
+The constructor references its class, so it is held weakly as well; it stays
+shared for as long as any provider's `_factory_cache` holds it.
+"""
+
+
+def _constructor_for(cls: Type[Any]) -> Callable[["ServiceProvider"], Any]:
+    """Return the compiled constructor for `cls`, shared by all live providers.
+
+    Plans and compiled functions only depend on the class, so providers built
+    repeatedly (tests, per-tenant containers) reuse them instead of compiling
+    again. Failures are not cached: a class whose hints cannot be resolved
+    yet is retried on its next resolution.
+
+    Args:
+        cls: The implementation class to construct.
+
+    Returns:
+        A callable taking the resolving [ServiceProvider][wd.di.container.ServiceProvider].
+    """
+    ref = _constructors.get(cls)
+    construct = ref() if ref is not None else None
+    if construct is None:
+        construct = _compile_constructor(cls, ServiceProvider._constructor_plan(cls))
+        _constructors[cls] = weakref.ref(construct)
+    return construct
+
+
+def _compile_constructor(
+    cls: Type[Any], plan: Tuple[Tuple[str, Type[Any]], ...]
+) -> Callable[["ServiceProvider"], Any]:
+    """Generate a straight-line constructor function for a fixed injection plan.
+
+    For a plan `(("repo", IRepo), ("log", Logger))` this compiles the equivalent of::
+
+        def _construct(sp, _cls=cls, _t0=IRepo, _t1=Logger):
+            get = sp.get_service
+            return _cls(repo=get(_t0), log=get(_t1))
+
+    Binding the class and dependency types as defaults makes them fast locals,
+    and the call avoids building an intermediate kwargs dict. Only parameter
+    names (always valid identifiers) are interpolated into the source; types
+    are passed through the namespace.
+
+    Args:
+        cls: The class to instantiate.
+        plan: The `(parameter name, service type)` pairs from `_constructor_plan`.
+
+    Returns:
+        A function taking the resolving [ServiceProvider][wd.di.container.ServiceProvider] and
+        returning a new instance of `cls`.
+    """
+    namespace: Dict[str, Any] = {"_cls": cls}
+    defaults = ["_cls=_cls"]
+    call_args = []
+    for i, (name, param_type) in enumerate(plan):
+        namespace[f"_t{i}"] = param_type
+        defaults.append(f"_t{i}=_t{i}")
+        call_args.append(f"{name}=get(_t{i})")
+
+    source = (
+        f"def _construct(sp, {', '.join(defaults)}):\n"
+        f"    get = sp.get_service\n"
+        f"    return _cls({', '.join(call_args)})\n"
+    )
+    exec(compile(source, f"<wd-di constructor for {cls.__qualname__}>", "exec"), namespace)
+    return namespace["_construct"]
+
+
+# ---------------------------------------------------------------------- #
+# Helper – dispose of a service instance
+# ---------------------------------------------------------------------- #
+
+_disposer_names: "weakref.WeakKeyDictionary[type, str]" = weakref.WeakKeyDictionary()
+"""Per class: `"dispose"` or `"close"`, whichever cleanup method the class itself defines."""
+
+
+def _disposer_for(inst: Any) -> Optional[str]:
+    """Returns the name of the cleanup method of `inst`.
+
+    `dispose` wins over `close`. A method found on the class is cached for
+    that class. Otherwise the instance itself is probed on every call, so
+    cleanup methods assigned per instance or served by `__getattr__` (e.g.
+    a decorator proxy wrapping a scoped service) are still found; a class
+    defining `__getattr__` is never cached unless it defines `dispose`.
+
+    Args:
+        inst: The service instance to inspect.
+
+    Returns:
+        `"dispose"`, `"close"`, or `None` if `inst` has neither.
+    """
+    cls = type(inst)
+    name = _disposer_names.get(cls)
+    if name is not None:
+        return name
+    if callable(getattr(cls, "dispose", None)):
+        name = "dispose"
+    elif callable(getattr(cls, "close", None)) and not hasattr(cls, "__getattr__"):
+        name = "close"
+    elif callable(getattr(inst, "dispose", None)):
+        return "dispose"
+    elif callable(getattr(inst, "close", None)):
+        return "close"
+    else:
+        return None
+    _disposer_names[cls] = name
+    return name
+
+
+def _call_disposer(inst: Any, name: str) -> None:
+    """Calls the cleanup method `name` of `inst`, reporting and swallowing errors.
+
+    Args:
+        inst: The instance to dispose of.
+        name: `"dispose"` or `"close"`, as returned by `_disposer_for`.
+    """
+    try:
+        getattr(inst, name)()
+    except Exception:
+        _logger.exception("Error %s %r", "disposing" if name == "dispose" else "closing", inst)
 
 
 # ---------------------------------------------------------------------- #
@@ -451,8 +854,8 @@ class ServiceProvider:
 def _key(obj: object) -> str:
     """Generate a unique, human-readable key for an object (service type or decorator factory).
 
-    This key is used for tracking objects in the `_resolution_stack` to detect
-    circular dependencies.
+    Used to render the frames of the `_resolution_stack` in circular
+    dependency error messages.
 
     Args:
         obj: The object for which to generate a key.
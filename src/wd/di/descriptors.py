@@ -12,7 +12,7 @@ creation. This mechanism enables first-class support for service decoration.
 from __future__ import annotations
 
 import inspect
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Any, Callable, Generic, List, Optional, TypeVar
 
 from .lifetimes import ServiceLifetime
@@ -157,14 +157,11 @@ class ServiceDescriptor(Generic[T]):
 
         Returns:
             A new [ServiceDescriptor][wd.di.descriptors.ServiceDescriptor] instance with the decorator added.
+
+        Raises:
+            TypeError: If `decorator` is not callable.
         """
-        return ServiceDescriptor(
-            self.service_type,
-            self.implementation_type,
-            self.factory,
-            self.lifetime,
-            [*self.decorators, decorator],
-        )
+        return replace(self, decorators=[*self.decorators, decorator])
 
     # ------------------------------------------------------------------ #
     # Validation
@@ -78,3 +78,26 @@ def _name(obj: object) -> str:  # pragma: no cover - pure formatting
     if hasattr(obj, "__name__"):
         return obj.__name__  # type: ignore[attr-defined]
     return repr(obj)
+
+
+# ---------------------------------------------------------------------- #
+# Helper - shared error message for constructor injection
+# ---------------------------------------------------------------------- #
+
+def _unresolvable_parameter_message(cls: type, name: str) -> str:
+    """Builds the `TypeError` message for a constructor parameter that cannot be injected.
+
+    Shared by registration-time checks and constructor planning so both
+    report the problem identically.
+
+    Args:
+        cls: The class whose constructor is being inspected.
+        name: The name of the offending parameter.
+
+    Returns:
+        The error message.
+    """
+    return (
+        f"Cannot resolve constructor parameter '{name}' for {cls.__qualname__}; "
+        "missing type annotation or type could not be resolved."
+    )
@@ -21,15 +21,17 @@ previous versions of this library does not require modification.
 
 from __future__ import annotations
 
+import inspect
 from typing import TYPE_CHECKING, Callable, Generic, Iterable, Optional, Type, TypeVar, overload
 
 from .config import IConfiguration, Options, OptionsBuilder
 from .descriptors import DecoratorFactory, ServiceDescriptor
-from .exceptions import InvalidOperationError
+from .exceptions import InvalidOperationError, _unresolvable_parameter_message
 from .lifetimes import ServiceLifetime
 
 if TYPE_CHECKING:  # pragma: no cover
     from .container import ServiceProvider
+    from .middleware_di import ApplicationBuilder
 
 __all__ = ["ServiceCollection"]
 
@@ -82,6 +84,30 @@ class ServiceCollection(Generic[T]):
                 "Cannot modify ServiceCollection after ServiceProvider has been built."
             )
 
+    @staticmethod
+    def _check_constructor(impl: Type[any]) -> None:
+        """Validates a decorated class's constructor when the decorator is applied.
+
+        Only the annotations' presence is checked, so string forward references
+        to classes defined later in the module remain valid. Resolving the
+        hints and compiling the factory still happens on first use. The
+        signature is read with `inspect.signature` directly, so registering
+        services does not import the container.
+
+        Raises:
+            TypeError: If a constructor parameter other than `self`, `*args` or
+                `**kwargs` has no type annotation.
+        """
+        try:
+            sig = inspect.signature(impl.__init__)
+        except (TypeError, ValueError):  # pragma: no cover - builtins without a signature
+            return
+        for name, param in sig.parameters.items():
+            if name == "self" or param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+                continue
+            if param.annotation is param.empty:
+                raise TypeError(_unresolvable_parameter_message(impl, name))
+
     def _add(
         self,
         lifetime: ServiceLifetime,
@@ -387,6 +413,7 @@ class ServiceCollection(Generic[T]):
             allowing the class definition to proceed as usual.
         """
         def _decorator(impl: Type[T]) -> Type[T]:
+            self._check_constructor(impl)
             if service_type is None:
                 self.add_singleton(impl, impl)
             else:
@@ -434,6 +461,7 @@ class ServiceCollection(Generic[T]):
             A decorator function that registers the class and returns it.
         """
         def _decorator(impl: Type[T]) -> Type[T]:
+            self._check_constructor(impl)
             if service_type is None:
                 self.add_scoped(impl, impl)
             else:
@@ -481,6 +509,7 @@ class ServiceCollection(Generic[T]):
             A decorator function that registers the class and returns it.
         """
         def _decorator(impl: Type[T]) -> Type[T]:
+            self._check_constructor(impl)
             if service_type is None:
                 self.add_transient(impl, impl)
             else:
@@ -546,6 +575,11 @@ class ServiceCollection(Generic[T]):
         A local import of [ServiceProvider][wd.di.container.ServiceProvider] is used here to avoid potential
         circular dependencies and to defer the import cost until it's actually needed.
 
+        Building is cheap: no constructors are inspected here. Type-hint
+        extraction and factory compilation happen lazily, the first time each
+        service is resolved, so services that are never requested cost only
+        their registration.
+
         Returns:
             A new [ServiceProvider][wd.di.container.ServiceProvider] instance configured with all the
             services defined in this collection.
@@ -555,6 +589,22 @@ class ServiceCollection(Generic[T]):
         self._is_built = True
         return ServiceProvider(self._services)
 
+    # ------------------------------------------------------------------ #
+    # Application builder (middleware)
+    # ------------------------------------------------------------------ #
+    def create_application_builder(self) -> "ApplicationBuilder":
+        """Creates an [ApplicationBuilder][wd.di.middleware_di.ApplicationBuilder] for this collection.
+
+        The middleware modules are imported on first use, so collections that
+        never configure middleware do not pay for loading them.
+
+        Returns:
+            A new [ApplicationBuilder][wd.di.middleware_di.ApplicationBuilder] bound to this collection.
+        """
+        from .middleware_di import create_application_builder  # local import keeps middleware optional
+
+        return create_application_builder(self)
+
     # ------------------------------------------------------------------ #
     # Introspection helpers
     # ------------------------------------------------------------------ #
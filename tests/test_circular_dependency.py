@@ -29,3 +29,123 @@ def test_circular_dependency_detection():
     )
     with pytest.raises(Exception, match=expected_pattern):
         provider.get_service(ServiceA)
+
+
+def test_concurrent_resolution_in_threads_is_not_a_cycle():
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    class Slow:
+        def __init__(self):
+            barrier.wait()  # both threads are now inside the same resolution
+
+    services = ServiceCollection()
+    services.add_transient(Slow)
+    provider = services.build_service_provider()
+
+    errors = []
+
+    def resolve():
+        try:
+            provider.get_service(Slow)
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=resolve) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+
+def test_singleton_cycle_entered_from_two_threads_is_reported_in_both():
+    import threading
+
+    # Lets each thread start its singleton before either follows the cycle;
+    # if one thread cannot get that far, the other proceeds after the timeout.
+    barrier = threading.Barrier(2, timeout=0.5)
+
+    class A:
+        pass
+
+    class B:
+        pass
+
+    def enter(sp, other):
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            pass
+        return sp.get_service(other)
+
+    services = ServiceCollection()
+    services.add_singleton_factory(A, lambda sp: enter(sp, B))
+    services.add_singleton_factory(B, lambda sp: enter(sp, A))
+    provider = services.build_service_provider()
+
+    errors = []
+
+    def resolve(service_type):
+        try:
+            provider.get_service(service_type)
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=resolve, args=(t,), daemon=True) for t in (A, B)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert len(errors) == 2
+    assert all("Circular dependency detected" in str(exc) for exc in errors)
+
+
+def test_nested_resolutions_share_one_resolution_stack():
+    from wd.di.container import _resolution_stack
+
+    seen = []
+
+    class Inner:
+        pass
+
+    class Outer:
+        def __init__(self, inner: Inner):
+            self.inner = inner
+
+    services = ServiceCollection()
+    services.add_transient_factory(Inner, lambda sp: seen.append(_resolution_stack.get()) or Inner())
+    services.add_transient_factory(Outer, lambda sp: seen.append(_resolution_stack.get()) or Outer(sp.get_service(Inner)))
+    provider = services.build_service_provider()
+
+    provider.get_service(Outer)
+
+    # The frames pair is installed once for the top-level call and mutated in place.
+    assert len(seen) == 2
+    assert seen[0] is seen[1]
+    assert seen[0][0] == []
+
+
+def test_distinct_types_with_the_same_name_are_not_a_cycle():
+    class Inner:
+        pass
+
+    class Outer:
+        def __init__(self, inner: Inner):
+            self.inner = inner
+
+    # Simulate two modules defining a class of the same name.
+    Inner.__qualname__ = Outer.__qualname__ = "Service"
+
+    services = ServiceCollection()
+    services.add_transient(Inner)
+    services.add_transient(Outer)
+    provider = services.build_service_provider()
+
+    # Frames are tracked by identity, so Outer -> Inner is not mistaken for
+    # a circular dependency.
+    assert isinstance(provider.get_service(Outer).inner, Inner)
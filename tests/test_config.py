@@ -131,3 +131,215 @@ def test_options_missing_section():
     db_options = provider.get_service(Options[DatabaseOptions])
     assert db_options.value.connection_string == ""
     assert db_options.value.max_connections == 10
+
+
+@pytest.mark.parametrize(
+    ("key", "expected"),
+    [
+        ("connectionString", "connection_string"),
+        ("maxConnections", "max_connections"),
+        ("Name", "name"),
+        ("HTTPPort", "h_t_t_p_port"),
+        ("already_snake", "already_snake"),
+        ("ÄpfelCount", "äpfel_count"),
+        ("fooÄbc", "foo_äbc"),
+        ("xΣy", "x_σy"),
+    ],
+)
+def test_camel_case_keys_map_to_snake_case(key, expected):
+    from wd.di.config import _to_snake_case
+
+    assert _to_snake_case(key) == expected
+
+
+def test_configuration_get_nested_paths_and_sections():
+    config = Configuration({"app": {"db": {"host": "localhost", "port": None}}, "a:b": 1})
+
+    assert config.get("app:db:host") == "localhost"
+    assert config.get("app:db") == {"host": "localhost", "port": None}
+    assert config.get("app:db:port") is None
+    # Keys are split on colons, so a literal colon in a key is not addressable.
+    assert config.get("a:b") is None
+
+
+def test_options_resolve_with_equal_but_distinct_generic_alias():
+    import typing
+
+    services = ServiceCollection()
+    services.add_singleton_factory(IConfiguration, lambda sp: Configuration({"app": {"name": "X"}}))
+    services.configure(AppSettings, section="app")
+    provider = services.build_service_provider()
+
+    alias = typing._GenericAlias(Options, (AppSettings,))
+    assert alias is not Options[AppSettings]
+    assert provider.get_service(alias).value.name == "X"
+
+
+def test_options_builder_uses_raw_data_of_custom_configuration():
+    class StaticConfiguration(IConfiguration):
+        def get(self, key):
+            return None
+
+        def get_section(self, section):
+            return self
+
+        def raw_data(self):
+            return {"connectionString": "custom", "maxConnections": 2}
+
+    options = OptionsBuilder(DatabaseOptions).bind_configuration(StaticConfiguration(), "db").build()
+
+    assert options.connection_string == "custom"
+    assert options.max_connections == 2
+
+
+def test_dataclass_options_are_constructed_with_configured_values():
+    seen = []
+
+    @dataclass(frozen=True)
+    class PoolOptions:
+        max_connections: int = 10
+        name: str = "default"
+
+        def __post_init__(self):
+            seen.append(self.max_connections)
+
+    class LegacyOptions:
+        def __init__(self):
+            self.max_connections = 10
+
+    config = Configuration({"pool": {"maxConnections": 50, "unknownKey": 1}})
+
+    options = OptionsBuilder(PoolOptions).bind_configuration(config, "pool").build()
+    legacy = OptionsBuilder(LegacyOptions).bind_configuration(config, "pool").build()
+
+    assert options == PoolOptions(max_connections=50)
+    assert seen[0] == 50
+    assert legacy.max_connections == 50
+    assert not hasattr(legacy, "unknown_key")
+
+
+def test_configuration_builder_env_variables(monkeypatch):
+    monkeypatch.setenv("WDTEST_Region", "eu")
+    monkeypatch.setenv("OTHER_Region", "us")
+
+    prefixed = ConfigurationBuilder().add_env_variables("WDTEST_").build()
+    unprefixed = ConfigurationBuilder().add_env_variables().build()
+
+    assert prefixed.get("Region") == "eu"
+    assert prefixed.get("OTHER_Region") is None
+    assert unprefixed.get("WDTEST_Region") == "eu"
+    assert unprefixed.get("OTHER_Region") == "us"
+
+    # A builder reuses its own snapshot; a new builder sees the change.
+    builder = ConfigurationBuilder().add_env_variables("WDTEST_")
+    monkeypatch.setenv("WDTEST_Region", "us")
+    assert builder.add_env_variables("WDTEST_").build().get("Region") == "eu"
+    assert ConfigurationBuilder().add_env_variables("WDTEST_").build().get("Region") == "us"
+
+
+def test_options_builder_returns_a_fresh_instance_per_build():
+    config = Configuration({"db": {"maxConnections": 5}})
+
+    first = OptionsBuilder(DatabaseOptions).bind_configuration(config, "db").build()
+    second = OptionsBuilder(DatabaseOptions).bind_configuration(config, "db").build()
+
+    # Mutating one consumer's options must not leak into another's.
+    assert first is not second
+    first.max_connections = 7
+    assert second.max_connections == 5
+
+
+def test_configured_options_are_singletons_per_provider():
+    def build():
+        services = ServiceCollection()
+        services.add_singleton_factory(IConfiguration, lambda sp: config)
+        services.configure(DatabaseOptions, section="db")
+        return services.build_service_provider()
+
+    config = Configuration({"db": {"maxConnections": 5}})
+    provider, other = build(), build()
+
+    options = provider.get_service(Options[DatabaseOptions]).value
+    assert provider.get_service(Options[DatabaseOptions]).value is options
+    assert other.get_service(Options[DatabaseOptions]).value is not options
+
+
+def test_configuration_get_section_is_memoized():
+    config = Configuration({"app": {"name": "X"}})
+
+    assert config.get_section("app") is config.get_section("app")
+    assert config.get_section("missing") is not config.get_section("missing")
+
+
+def test_options_builder_binds_class_and_dynamic_attributes():
+    from wd.di.config import _attribute_names
+
+    class ClassLevelOptions:
+        retries = 1
+
+    class DynamicOptions:
+        def __getattr__(self, name):
+            return None
+
+    config = Configuration({"retries": 3, "anything": "x"})
+
+    static = OptionsBuilder(ClassLevelOptions).bind_configuration(config).build()
+    dynamic = OptionsBuilder(DynamicOptions).bind_configuration(config).build()
+
+    assert static.retries == 3
+    assert not hasattr(static, "anything")
+    assert "retries" in _attribute_names[ClassLevelOptions]
+    assert dynamic.anything == "x"
+    assert DynamicOptions not in _attribute_names
+
+
+def test_configuration_builder_json_file(tmp_path):
+    settings = tmp_path / "appsettings.json"
+    settings.write_bytes('{"app": {"name": "Café"}}'.encode("utf-8"))
+
+    config = (
+        ConfigurationBuilder()
+        .add_json_file(str(settings))
+        .add_json_file(tmp_path / "missing.json")
+        .build()
+    )
+
+    assert config.get("app:name") == "Café"
+
+
+def test_configuration_index_is_built_on_first_get():
+    config = Configuration({"db": {"host": "localhost"}})
+    section = config.get_section("db")
+
+    assert section._flat is None
+    assert OptionsBuilder(DatabaseOptions).bind_configuration(section).build() == DatabaseOptions()
+    assert section._flat is None
+    assert section.get("host") == "localhost"
+    assert section._flat is None  # top-level keys skip the index
+    assert config.get("db:host") == "localhost"
+    assert config._flat == {"db": {"host": "localhost"}, "db:host": "localhost"}
+
+
+def test_configuration_accepts_dict_subclasses_at_every_level():
+    from collections import OrderedDict
+
+    inner = OrderedDict(level=OrderedDict(default="Info"))
+    config = Configuration({"logging": inner})
+
+    assert config.get("logging:level:default") == "Info"
+    inner["added"] = OrderedDict(later=True)  # reached through the fallback walk
+    assert config.get("logging:added:later") is True
+    assert config.get_section("logging").get("level:default") == "Info"
+
+
+def test_configuration_builder_merges_nested_sections():
+    defaults = {"db": {"host": "localhost", "pool": {"size": 5, "timeout": 30}}}
+    overrides = {"db": {"pool": {"size": 20}}, "name": "app"}
+
+    config = ConfigurationBuilder().add_dictionary(defaults).add_dictionary(overrides).build()
+
+    assert config.get("db:host") == "localhost"
+    assert config.get("db:pool:size") == 20
+    assert config.get("db:pool:timeout") == 30
+    assert config.get("name") == "app"
+    assert defaults["db"]["pool"]["size"] == 5  # sources are never written to
@@ -0,0 +1,167 @@
+import pytest
+
+from wd.di import ServiceCollection
+from wd.di.container import _parameter_names_for, _type_hints_for
+
+
+class Dependency:
+    pass
+
+
+class Consumer:
+    def __init__(self, dependency: Dependency):
+        self.dependency = dependency
+
+
+def test_constructor_introspection_is_cached_per_class(monkeypatch):
+    import wd.di.container
+
+    services = ServiceCollection()
+    services.add_transient(Dependency)
+    services.add_transient(Consumer)
+    provider = services.build_service_provider()
+    provider.get_service(Consumer)
+
+    calls = []
+    real_get_type_hints = wd.di.container.get_type_hints
+    monkeypatch.setattr(
+        wd.di.container, "get_type_hints", lambda *a, **kw: calls.append(a) or real_get_type_hints(*a, **kw)
+    )
+    _type_hints_for.cache_clear()
+    for _ in range(3):
+        assert isinstance(provider.get_service(Consumer).dependency, Dependency)
+
+    # Repeated transient resolutions must not introspect the constructors again.
+    assert calls == []
+    assert _type_hints_for(Consumer) == {"dependency": Dependency}
+    assert _type_hints_for(Consumer) == {"dependency": Dependency}
+    assert len(calls) == 1
+
+
+def test_caches_do_not_keep_resolved_classes_alive():
+    import gc
+    import weakref
+
+    def resolve_temporary_class():
+        class Temporary:
+            def __init__(self, dependency: Dependency):
+                self.dependency = dependency
+
+            def close(self):
+                pass
+
+        services = ServiceCollection()
+        services.add_transient(Dependency)
+        services.add_scoped(Temporary)
+        provider = services.build_service_provider()
+        with provider.create_scope() as scope:
+            scope.get_service(Temporary)
+        return weakref.ref(Temporary)
+
+    temporary = resolve_temporary_class()
+    gc.collect()
+
+    assert temporary() is None
+
+
+def test_compiled_factory_is_shared_with_scopes():
+    services = ServiceCollection()
+    services.add_transient(Dependency)
+    services.add_scoped(Consumer)
+    provider = services.build_service_provider()
+
+    with provider.create_scope() as scope:
+        first = scope.get_service(Consumer)
+    compiled = provider._factory_cache[Consumer]
+
+    with provider.create_scope() as scope:
+        second = scope.get_service(Consumer)
+
+    assert first is not second
+    assert provider._factory_cache[Consumer] is compiled
+
+
+def test_registration_and_build_do_not_introspect_constructors():
+    class Unresolvable:
+        def __init__(self, missing: "NotDefinedAnywhere"):  # noqa: F821
+            self.missing = missing
+
+    services = ServiceCollection()
+    services.add_transient(Unresolvable)
+    services.add_transient(Dependency)
+    provider = services.build_service_provider()
+
+    # Unrelated services resolve fine; the bad hint only matters once requested.
+    assert isinstance(provider.get_service(Dependency), Dependency)
+    assert Unresolvable not in provider._factory_cache
+
+
+class NeedsLaterType:
+    def __init__(self, later: "DefinedLater"):  # noqa: F821
+        self.later = later
+
+
+def test_failed_constructor_plan_is_not_cached():
+    services = ServiceCollection()
+    services.add_transient(Dependency)
+    services.add_transient(NeedsLaterType)
+    provider = services.build_service_provider()
+
+    with pytest.raises(RuntimeError, match="NameError"):
+        provider.get_service(NeedsLaterType)
+    assert NeedsLaterType not in provider._factory_cache
+
+    # Once the name exists, the same provider plans the constructor again.
+    globals()["DefinedLater"] = Dependency
+    try:
+        assert isinstance(provider.get_service(NeedsLaterType).later, Dependency)
+    finally:
+        del globals()["DefinedLater"]
+
+
+def test_parameter_names_match_signature_for_all_constructor_shapes():
+    import functools
+
+    class KeywordOnly:
+        def __init__(self, dependency: Dependency, *args, extra: Dependency, **kwargs):
+            local_variable = dependency  # noqa: F841
+
+    def passthrough(init):
+        @functools.wraps(init)
+        def wrapper(self, *args, **kwargs):
+            init(self, *args, **kwargs)
+        return wrapper
+
+    class Wrapped:
+        @passthrough
+        def __init__(self, dependency: Dependency):
+            self.dependency = dependency
+
+    assert _parameter_names_for(KeywordOnly) == ("dependency", "extra")
+    assert _parameter_names_for(Wrapped) == ("dependency",)
+    assert _parameter_names_for(Dependency) == ()
+
+
+def test_compiled_constructor_is_shared_across_providers():
+    def build():
+        services = ServiceCollection()
+        services.add_transient(Dependency)
+        services.add_transient(Consumer)
+        provider = services.build_service_provider()
+        provider.get_service(Consumer)
+        return provider
+
+    first, second = build(), build()
+
+    assert first._factory_cache[Consumer] is second._factory_cache[Consumer]
+
+
+def test_type_hints_resolve_for_class_from_unimported_module():
+    class Detached:
+        def __init__(self, dependency: "Dependency"):
+            self.dependency = dependency
+
+    # e.g. classes created by exec() or pickled under a stale module name
+    Detached.__module__ = "not_an_imported_module"
+
+    assert _type_hints_for(Detached) == {"dependency": Dependency}
@@ -1,3 +1,5 @@
+import pytest
+
 from wd.di import ServiceCollection
 
 services = ServiceCollection()
@@ -24,3 +26,36 @@ def test_decorators():
     bar_service.do_something_else()
 
     assert bar_service is not None
+
+
+def test_decorator_rejects_unannotated_constructor_at_definition():
+    local = ServiceCollection()
+
+    with pytest.raises(TypeError, match="'foo'"):
+        @local.scoped()
+        class Unannotated:
+            def __init__(self, foo):
+                self.foo = foo
+
+    assert len(local) == 0
+
+
+
+forward_services = ServiceCollection()
+
+
+@forward_services.transient()
+class Early:
+    def __init__(self, late: "Late", *args, **kwargs):
+        self.late = late
+
+
+@forward_services.transient()
+class Late:
+    pass
+
+
+def test_decorator_accepts_forward_references_defined_later():
+    provider = forward_services.build_service_provider()
+
+    assert isinstance(provider.get_service(Early).late, Late)
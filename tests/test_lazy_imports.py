@@ -0,0 +1,19 @@
+import subprocess
+import sys
+
+
+def test_importing_package_defers_container_and_middleware():
+    code = (
+        "import sys\n"
+        "from wd.di import ServiceCollection\n"
+        "services = ServiceCollection()\n"
+        "@services.singleton()\n"
+        "class Registered:\n"
+        "    def __init__(self, name: str = ''): pass\n"
+        "assert 'wd.di.container' not in sys.modules\n"
+        "assert 'wd.di.middleware' not in sys.modules\n"
+        "import wd.di\n"
+        "assert wd.di.ServiceProvider.__module__ == 'wd.di.container'\n"
+        "assert 'wd.di.container' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -40,3 +40,62 @@ def test_singleton_resolved_from_scope_without_cycle():
 
     # singleton's counter was incremented twice (once per scope)
     assert provider.get_service(RootSingleton).counter == 2
+
+
+def test_racing_threads_construct_the_singleton_once():
+    import threading
+
+    started = threading.Event()
+    release = threading.Event()
+    constructed = []
+
+    class Conn:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    class Repo:
+        def __init__(self, conn: Conn):
+            self.conn = conn
+            constructed.append(self)
+            started.set()
+            release.wait(5)  # hold the first build while the second thread arrives
+
+        def dispose(self):
+            self.conn.close()
+
+    services = ServiceCollection()
+    services.add_singleton(Conn)
+    services.add_singleton(Repo)
+    provider = services.build_service_provider()
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(provider.get_service(Repo)))
+        for _ in range(2)
+    ]
+    threads[0].start()
+    assert started.wait(5)
+    threads[1].start()
+    threads[1].join(0.1)  # the second thread waits for the first build
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(constructed) == 1
+    assert results[0] is results[1] is provider.get_service(Repo)
+    assert not results[0].conn.closed
+
+
+def test_singleton_resolver_returns_published_instance_directly():
+    services = ServiceCollection()
+    services.add_singleton(RootSingleton)
+    provider = services.build_service_provider()
+
+    first = provider.get_service(RootSingleton)
+    provider._singleton_cache.clear()  # later hits no longer consult the cache
+
+    with provider.create_scope() as scope:
+        assert scope.get_service(RootSingleton) is first
+    assert provider.get_service(RootSingleton) is first
@@ -89,3 +89,110 @@ def test_close_method_is_called_for_disposable():
 
     # Exiting the scope should trigger the close method.
     assert disposable_instance.is_closed
+
+
+def test_dispose_is_preferred_and_errors_do_not_stop_disposal(caplog):
+    calls = []
+
+    class Both:
+        def dispose(self):
+            calls.append("dispose")
+
+        def close(self):
+            calls.append("close")
+
+    class Failing:
+        def close(self):
+            raise RuntimeError("boom")
+
+    class Plain:
+        pass
+
+    services = ServiceCollection()
+    services.add_scoped(Failing)
+    services.add_scoped(Both)
+    services.add_scoped(Plain)
+    provider = services.build_service_provider()
+
+    with provider.create_scope() as scope:
+        scope.get_service(Failing)
+        scope.get_service(Both)
+        scope.get_service(Plain)
+        assert [name for _, name in scope._disposables] == ["close", "dispose"]
+
+    assert calls == ["dispose"]
+    assert "Error closing" in caplog.text
+    assert "boom" in caplog.text  # logged with the traceback
+
+
+def test_racing_threads_in_one_scope_share_the_scoped_instance():
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+    disposed = []
+
+    class RacedScoped:
+        def __init__(self):
+            barrier.wait()  # both threads construct before either caches
+
+        def dispose(self):
+            disposed.append(self)
+
+    services = ServiceCollection()
+    services.add_scoped(RacedScoped)
+    provider = services.build_service_provider()
+    scope = provider.create_scope()
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(scope.get_service(RacedScoped)))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 2
+    assert results[0] is results[1]
+    # The duplicate is dropped, not disposed: only the shared instance is
+    # disposed, and only with the scope.
+    assert disposed == []
+    scope.dispose()
+    assert disposed == [results[0]]
+
+
+def test_cleanup_methods_from_proxies_and_instances_are_found():
+    class Session:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    class SessionProxy:
+        def __init__(self, inner):
+            self._inner = inner
+
+        def __getattr__(self, name):
+            return getattr(self._inner, name)
+
+    class Handle:
+        def __init__(self):
+            self.released = False
+            self.close = self.release
+
+        def release(self):
+            self.released = True
+
+    services = ServiceCollection()
+    services.add_scoped(Session)
+    services.decorate(Session, lambda sp, inner: SessionProxy(inner))
+    services.add_scoped(Handle)
+    provider = services.build_service_provider()
+
+    with provider.create_scope() as scope:
+        proxy = scope.get_service(Session)
+        handle = scope.get_service(Handle)
+
+    assert proxy._inner.closed
+    assert handle.released
@@ -124,4 +124,24 @@ def test_circular_decorator_dependency_detected():
     
     expected_deco_key_name = _test_key(recursive_decorator_factory)
     assert expected_deco_key_name in str(excinfo.value)
-    assert "Circular decorator chain detected" in str(excinfo.value) 
\ No newline at end of file
+    assert "Circular decorator chain detected" in str(excinfo.value) 
+
+def test_with_decorator_returns_a_validated_copy():
+    from wd.di.descriptors import ServiceDescriptor
+
+    def first(sp, inner):
+        return inner
+
+    def second(sp, inner):
+        return inner
+
+    base = ServiceDescriptor.singleton(IMessageHandler, ConcreteMessageHandler)
+
+    decorated = base.with_decorator(first).with_decorator(second)
+
+    assert decorated == base
+    assert decorated.lifetime is base.lifetime
+    assert decorated.decorators == [first, second]
+    assert base.decorators == []
+    with pytest.raises(TypeError, match="is not callable"):
+        decorated.with_decorator("not a decorator")